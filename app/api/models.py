@@ -82,8 +82,9 @@ class IDCardRequest(BaseModel):
             raise ValueError("图像数据不能为空")
         
         # 移除可能的base64前缀
-        if "base64," in v:
-            v = v.split("base64,")[1]
+        prefix_end = v.find("base64,")
+        if prefix_end != -1:
+            v = v[prefix_end + 7:]
         
         return v
 
@@ -155,11 +155,27 @@ MEMORY_OPTIMIZATION = os.getenv("MEMORY_OPTIMIZATION", "True").lower() in ("true
 # 计算公式：OCR_PROCESS_POOL_SIZE * 2 = 推荐并发数
 MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "3"))
 
+# 服务器级连接并发上限（每个工作进程，超出时直接返回503）
+# 📌 性能影响：统计所有打开的连接（包括空闲的keep-alive连接、健康检查、文档页面），
+#    需远大于OCR并发数；OCR任务的并发由进程池控制。设为0表示不限制
+# 🚀 高性能：1000  💾 内存受限：200  🔧 生产环境：500
+SERVER_LIMIT_CONCURRENCY = int(os.getenv("SERVER_LIMIT_CONCURRENCY", "500"))
+
 # 请求处理完成后是否强制垃圾回收
 # 📌 性能影响：会稍微增加响应时间，但能有效降低内存占用
 # 🚀 高性能：False  💾 内存受限：True  🔧 生产环境：True
 ENABLE_GC_AFTER_REQUEST = os.getenv("ENABLE_GC_AFTER_REQUEST", "True").lower() in ("true", "1", "t")
 
+# 第0代垃圾回收阈值（服务启动时设置，并冻结启动阶段创建的对象）
+# 📌 性能影响：默认700会频繁触发回收，调高可减少请求处理中的GC停顿；设为0保持Python默认值
+# 🚀 高性能：50000  💾 内存受限：0  🔧 生产环境：10000
+GC_THRESHOLD = int(os.getenv("OCR_GC_THRESHOLD", "10000"))
+
+# 每个工作进程处理多少请求后自动重启（仅Gunicorn多进程模式生效，带随机抖动避免同时重启）
+# 📌 性能影响：定期回收工作进程，限制长期运行中的内存增长；设为0禁用
+# 🚀 高性能：0  💾 内存受限：500  🔧 生产环境：1000
+MAX_REQUESTS_PER_WORKER = int(os.getenv("OCR_MAX_REQUESTS_PER_WORKER", "1000"))
+
 # ============================================================================
 # 🗄️ 请求缓存配置（性能优化）
 # ============================================================================
@@ -198,6 +214,18 @@ CACHE_DEBUG_RESULTS = os.getenv("CACHE_DEBUG_RESULTS", "False").lower() in ("tru
 # 🚀 高性能：True  💾 内存受限：False  🔧 生产环境：True
 CACHE_ENABLE_STATS = os.getenv("CACHE_ENABLE_STATS", "True").lower() in ("true", "1", "t")
 
+# 是否启用OCR结果磁盘缓存（需要安装diskcache）
+# 📌 性能影响：服务重启后仍可命中之前识别过的图片，避免重复OCR推理
+# ⚠️  注意：缓存内容包含身份证识别结果（个人信息），请确保缓存目录的访问权限
+# 🚀 高性能：True  💾 内存受限：True  🔧 生产环境：按数据安全要求决定
+OCR_DISK_CACHE_ENABLED = os.getenv("OCR_DISK_CACHE_ENABLED", "False").lower() in ("true", "1", "t")
+
+# OCR结果磁盘缓存目录
+OCR_DISK_CACHE_DIR = os.getenv("OCR_DISK_CACHE_DIR", str(Path(os.getenv("OCR_MODEL_DIR", str(BASE_DIR / "models"))) / "ocr_cache"))
+
+# OCR结果磁盘缓存容量上限（MB），超出后按LRU淘汰
+OCR_DISK_CACHE_SIZE_MB = int(os.getenv("OCR_DISK_CACHE_SIZE_MB", "512"))
+
 # ============================================================================
 # 📝 日志配置（影响磁盘I/O和内存）
 # ============================================================================
@@ -266,11 +294,21 @@ OCR_PERFORMANCE_CONFIG = {
     "max_image_size": int(os.getenv("OCR_MAX_IMAGE_SIZE", "1600")),  # 最大图像尺寸（像素）
     "resize_quality": int(os.getenv("OCR_RESIZE_QUALITY", "85")),   # 图像压缩质量（0-100）
     
+    # ⚡ 推理后端：paddle（默认）或 onnx（需安装rapidocr_onnxruntime，CPU推理更快）
+    "backend": os.getenv("OCR_BACKEND", "paddle").lower(),
+    
     # 🔧 PaddleOCR性能参数
     "det_limit_side_len": int(os.getenv("OCR_DET_LIMIT_SIDE_LEN", "960")),  # 检测模型输入尺寸限制
-    "rec_batch_num": int(os.getenv("OCR_REC_BATCH_NUM", "6")),              # 识别批次大小
+    "rec_batch_num": int(os.getenv("OCR_REC_BATCH_NUM", "16")),             # 识别批次大小（单张证件约10行文本，一次前向完成）
+    "cls_batch_num": int(os.getenv("OCR_CLS_BATCH_NUM", "16")),             # 方向分类批次大小
     "max_text_length": int(os.getenv("OCR_MAX_TEXT_LENGTH", "25")),         # 最大文本长度
     "cpu_threads": int(os.getenv("OCR_CPU_THREADS", "4")),                  # CPU线程数
+    "enable_mkldnn": os.getenv("OCR_ENABLE_MKLDNN", "true").lower() == "true",  # 启用MKLDNN加速（Intel CPU）
+    "use_gpu": os.getenv("OCR_USE_GPU", "false").lower() == "true",          # 启用GPU推理（需安装CUDA版paddlepaddle，否则自动回退CPU）
+    "use_tensorrt": os.getenv("OCR_USE_TENSORRT", "false").lower() == "true",  # GPU下启用TensorRT子图加速（FP16）
+    
+    # ⚡ INT8量化模型（PaddleSlim导出），目录下按det/rec/cls子目录存放，缺失的模型自动回退FP32
+    "int8_model_dir": os.getenv("OCR_INT8_MODEL_DIR", str(Path(os.getenv("OCR_MODEL_DIR", str(BASE_DIR / "models"))) / "int8")),
     
     # 🎯 检测和识别阈值优化
     "det_db_thresh": float(os.getenv("OCR_DET_DB_THRESH", "0.3")),          # 检测阈值
@@ -30,6 +30,25 @@ except ImportError:
 class ImageProcessor:
     """图像处理类，用于身份证图像的预处理"""
     
+    @staticmethod
+    def to_image_bytes(image_data: Union[str, bytes]) -> bytes:
+        """
+        将base64编码的图像数据转换为二进制数据，二进制数据原样返回
+        
+        Args:
+            image_data: base64编码的图像数据或二进制图像数据
+            
+        Returns:
+            二进制图像数据
+        """
+        if isinstance(image_data, str):
+            # 移除可能的base64前缀
+            prefix_end = image_data.find("base64,")
+            if prefix_end != -1:
+                image_data = image_data[prefix_end + 7:]
+            return base64.b64decode(image_data)
+        return image_data
+    
     @staticmethod
     def decode_image(image_data: Union[str, bytes]) -> np.ndarray:
         """
@@ -45,17 +64,7 @@ class ImageProcessor:
             ValueError: 图像数据无效
         """
         try:
-            # 如果是base64字符串
-            if isinstance(image_data, str):
-                # 移除可能的base64前缀
-                if "base64," in image_data:
-                    image_data = image_data.split("base64,")[1]
-                
-                # 解码base64数据
-                image_bytes = base64.b64decode(image_data)
-            else:
-                # 已经是二进制数据
-                image_bytes = image_data
+            image_bytes = ImageProcessor.to_image_bytes(image_data)
             
             # 将二进制数据转换为numpy数组
             nparr = np.frombuffer(image_bytes, np.uint8)
@@ -130,6 +139,32 @@ class ImageProcessor:
         
         return resized_image
     
+    @staticmethod
+    def resize_for_detection(image: np.ndarray, max_size: int) -> np.ndarray:
+        """
+        按检测模型尺寸上限等比例缩小图像
+        
+        宽高使用同一缩放比例，保持宽高比且不放大小图；宽高取32倍数的对齐由检测模型内部完成，
+        这里不做对齐，避免识别模型裁剪文本行时使用变形的图像。
+        
+        Args:
+            image: 原始图像
+            max_size: 最长边上限（会被限制在det_limit_side_len以内）
+            
+        Returns:
+            调整大小后的图像
+        """
+        height, width = image.shape[:2]
+        max_size = min(max_size, OCR_PERFORMANCE_CONFIG.get("det_limit_side_len", 960))
+        
+        scale = max_size / max(height, width)
+        if scale >= 1.0:
+            return image
+        
+        new_width = max(1, int(round(width * scale)))
+        new_height = max(1, int(round(height * scale)))
+        return cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_AREA)
+    
     @staticmethod
     def enhance_image(image: np.ndarray) -> np.ndarray:
         """
@@ -275,8 +310,8 @@ class ImageProcessor:
                     w = min(w, image.shape[1] - x)
                     h = min(h, image.shape[0] - y)
                     
-                    # 裁剪图像
-                    card_image = image[y:y+h, x:x+w]
+                    # 裁剪图像（复制为连续内存，避免后续推理时再次拷贝）
+                    card_image = np.ascontiguousarray(image[y:y+h, x:x+w])
                     
                     logger.info(f"成功检测到身份证，轮廓 #{i+1}, 面积比例: {area_ratio:.3f}, 宽高比: {aspect_ratio:.2f}")
                     return card_image, True
@@ -289,7 +324,7 @@ class ImageProcessor:
                 
                 # 如果最大轮廓面积比例足够大，可能是身份证
                 if area_ratio > 0.3:
-                    card_image = image[y:y+h, x:x+w]
+                    card_image = np.ascontiguousarray(image[y:y+h, x:x+w])
                     logger.info(f"使用最大轮廓作为身份证，面积比例: {area_ratio:.3f}")
                     return card_image, True
             
@@ -429,12 +464,13 @@ class ImageProcessor:
                 return np.zeros((300, 500, 3), dtype=np.uint8)
 
     @classmethod
-    def preprocess_id_card_image(cls, image_data: Union[str, bytes]) -> np.ndarray:
+    def preprocess_id_card_image(cls, image_data: Union[str, bytes], max_size: int = 800) -> np.ndarray:
         """
         身份证图像预处理流程（内存优化版本）
         
         Args:
             image_data: base64编码的图像数据或二进制图像数据
+            max_size: 最长边上限，默认800（不超过检测模型尺寸上限）
             
         Returns:
             预处理后的图像
@@ -453,8 +489,8 @@ class ImageProcessor:
             if MEMORY_OPTIMIZATION:
                 logger.debug(f"图像解码完成，尺寸: {image.shape[1]}x{image.shape[0]}，耗时: {(time.time() - start_time)*1000:.2f}ms")
             
-            # 调整图像大小
-            image = cls.resize_image(image, max_size=800)  # 降低最大尺寸以节省内存
+            # 按检测模型尺寸上限等比例缩小（保持宽高比），32倍数对齐由检测模型内部完成
+            image = cls.resize_for_detection(image, max_size=max_size)  # 降低最大尺寸以节省内存
             if MEMORY_OPTIMIZATION:
                 logger.debug(f"图像大小调整完成，调整后尺寸: {image.shape[1]}x{image.shape[0]}")
             
@@ -5,7 +5,11 @@ import os
 import re
 import time
 import hashlib
+import threading
 import numpy as np
+from collections import OrderedDict
+from functools import lru_cache
+from bisect import bisect_left, bisect_right
 from typing import Dict, List, Any, Optional, Union, Tuple
 from pathlib import Path
 
@@ -18,77 +22,412 @@ if not hasattr(np, 'float'):
 if not hasattr(np, 'bool'):
     np.bool = bool
 
+# 可选依赖：Aho-Corasick多模式匹配，未安装时退回逐个子串查找
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# 可选依赖：OCR结果磁盘缓存
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+# 可选依赖：ONNXRuntime推理后端（RapidOCR，与PaddleOCR模型同源）
+try:
+    from rapidocr_onnxruntime import RapidOCR
+except ImportError:
+    RapidOCR = None
+
 from paddleocr import PaddleOCR
 from app.config import OCR_MODEL_DIR, ID_CARD_CONFIG, ID_CARD_FIELD_MAPPING, FOREIGN_ID_CARD_CONFIG, FOREIGN_ID_CARD_FIELD_MAPPING, OCR_PERFORMANCE_CONFIG
+from app.config import OCR_DISK_CACHE_ENABLED, OCR_DISK_CACHE_DIR, OCR_DISK_CACHE_SIZE_MB, OCR_PROCESS_POOL_SIZE
 from app.core.image_processor import ImageProcessor
 from app.utils.logger import get_logger
 
+# 缓存键哈希函数：优先使用xxHash（非加密哈希，速度远高于MD5），未安装时退回blake2b
+try:
+    import xxhash
+
+    def _hash_bytes(data: bytes) -> str:
+        return xxhash.xxh3_128_hexdigest(data)
+except ImportError:
+    def _hash_bytes(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
 # 获取logger
 logger = get_logger("ocr_engine")
 
+# ============================================================================
+# 预编译正则表达式（模块加载时编译一次，避免每次调用查找re内部缓存）
+# ============================================================================
+
+# 18位身份证号码：地区码 + 出生日期 + 顺序码 + 校验位（各变体共用同一模式）
+_ID_NUMBER_PATTERN = r"[1-9]\d{5}(?:19|20)\d{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[12]\d|3[01])\d{3}[\dXx]"
+# 不带锚点，用于在文本中查找
+_ID_NUMBER_RE = re.compile(_ID_NUMBER_PATTERN)
+# 整段文本即为身份证号码
+_ID_NUMBER_FULL_RE = re.compile(f"^{_ID_NUMBER_PATTERN}$")
+# 多行模式，在拼接后的文本中逐行整行匹配
+_ID_NUMBER_LINE_RE = re.compile(f"^{_ID_NUMBER_PATTERN}$", re.MULTILINE)
+_ID_NUMBER_DIGITS_RE = re.compile(r"^\d{17}[\dXx]$")
+
+# 身份证正面字段
+# 按性别、民族、出生的优先级合并为一个正则，每个分支前的[\s\S]*?保证
+# 先在整段文本中尝试前一个字段，再尝试下一个（与逐个search等价）
+_FIELD_RE = re.compile(
+    r"[\s\S]*?性别[\s:：]*(?P<性别>[男女])"  # 只匹配"男"或"女"
+    r"|[\s\S]*?民族[\s:：]*(?P<民族>.+)"
+    r"|[\s\S]*?出生[\s:：]*(?P<出生>.+)"
+)
+_SEX_RE = re.compile(r"性别[\s:：]*([男女])")
+_NATION_TOKEN_RE = re.compile(r"民族[\s:：]*([^\s]+)")
+_SEX_NATION_RE = re.compile(r"性别([男女])民族([^\s]+)")
+_DATE_RES = (
+    re.compile(r"(\d{4}年\d{1,2}月\d{1,2}日)"),  # 1990年1月1日
+    re.compile(r"(\d{4}[\./\-年]\d{1,2}[\./\-月]\d{1,2}[日]?)"),  # 1990.1.1, 1990-1-1
+    re.compile(r"(\d{4}[年\s]+\d{1,2}[月\s]+\d{1,2}[日]?)"),  # 1990 1 1
+)
+
+# 住址清理
+_ADDRESS_PREFIX_RE = re.compile(r"住址[\s:：]*")
+_TRAILING_PUNCT = (",", "，", ".", "。", "、", "；", ";")
+_DIGIT_RE = re.compile(r'\d')
+_CJK_CHAR_RE = re.compile(r'[\u4e00-\u9fff]')
+_NAME_LABEL_RE = re.compile(r"姓名[\s:：]*(.+)")
+# 常见的非姓名词汇
+_NAME_EXCLUDED_RE = re.compile(r"性别|民族|出生|住址|公民|身份|号码|签发|机关|有效|期限")
+
+# 门牌号格式（合并为一个正则，一次匹配判断是否符合任一格式）
+_HOUSE_NUMBER_RE = re.compile(
+    r'^\d+号?$'  # 纯数字或数字+号
+    r'|^[0-9-]+号?$'  # 数字-数字格式
+    r'|^\d+[号室栋单元]$'  # 数字+单位
+    r'|^\d+[A-Za-z]号?$'  # 数字+字母
+    r'|^[村组社区队]\d+号?$'  # 村/组/社区/队+数字
+    r'|^.*[村组社区队]\d+号?$'  # 任意文本+村/组/社区/队+数字
+)
+
+# 住址后处理与规则补全
+_VILLAGE_CHARS = frozenset('村组社区队')  # 单字符集合判断，比字符类正则更快
+_VILLAGE_SUFFIXES = tuple(_VILLAGE_CHARS)  # 结尾判断用str.endswith，无需正则
+_TOWNSHIP_SUFFIXES = ("乡", "镇")
+_VILLAGE_NAME_RE = re.compile(r'([^住址]*[村组社区队])')
+_VILLAGE_NAME_END_RE = re.compile(r'\w+[村组社区队]$')
+_HOUSE_NUMBER_HAO_RE = re.compile(r'\d+号')
+_NUMBER_HAO_RE = re.compile(r'\d+号?')
+_VILLAGE_NUMBER_RES = (
+    re.compile(r'([村组社区队]\d+号?)'),  # 村218号, 组5号
+    re.compile(r'([^住址]*[村组社区队]\d+号?)'),  # 边庄村218号
+    re.compile(r'([村组社区队][^住址]*\d+号?)'),  # 村边庄218号
+    re.compile(r'([^住址]*[村组社区队][^住址]*\d+号?)'),  # 任意文本+村+任意文本+数字+号
+)
+_HOUSE_NUMBER_SEARCH_RES = (
+    re.compile(r'(\d+号)'),  # 218号
+    re.compile(r'(\d+[室栋单元])'),  # 218室
+    re.compile(r'([A-Za-z]?\d+号?)'),  # A218号, 218
+    re.compile(r'(\d+-\d+号?)'),  # 218-1号
+    re.compile(r'(\d+[A-Za-z]号?)'),  # 218A号
+    re.compile(r'(第?\d+号)'),  # 第218号
+    re.compile(r'(\d+[弄巷里街道路]?\d*号?)'),  # 218弄5号
+)
+
+# 地址文本有效性检查
+_ID_NUMBER_15_RE = re.compile(r'^\d{15}$')
+_LONG_DIGITS_RE = re.compile(r'^\d{10,}$')
+_YEAR_RE = re.compile(r'^(19|20)\d{2}$')
+_ADDRESS_CHARS = frozenset('省市区县乡镇村组路街道号室社区队栋单元巷弄里')
+_BIRTH_KEYWORDS = ("出生", "生日")
+_BIRTH_ADDRESS_CHARS = frozenset('省市区县乡镇村组路街道号室栋')  # 与"单元"一起判断出生相关文本是否含地址
+_PERSONAL_FIELD_VALUES = frozenset(["男", "女", "汉", "回", "蒙", "藏", "维", "苗", "彝", "壮", "满"])
+_SHORT_HOUSE_NUMBER_RE = re.compile(r'^\d{1,4}号?[A-Za-z]?$')
+
+# 身份证背面字段
+_ISSUE_AUTHORITY_RE = re.compile(r"签发机关[\s:：]*(.+)")
+_VALID_PERIOD_RE = re.compile(r"有效期[限至]?[\s:：]*(.+)")
+
+# 外国人永久居留身份证字段
+_FOREIGN_SEX_RE = re.compile(r'^[男女]/[MF]$')
+_DOT_DATE_RE = re.compile(r'^\d{4}\.\d{2}\.\d{2}$')
+_DOT_DATE_RANGE_RE = re.compile(r'\d{4}\.\d{2}\.\d{2}-\d{4}\.\d{2}\.\d{2}')
+_DIGITS_18_RE = re.compile(r'^\d{18}$')
+_OLD_RESIDENCE_NUMBER_RE = re.compile(r'^[A-Z]+\d+$')
+_PUNCT_ONLY_RE = re.compile(r'^[^\w\u4e00-\u9fff]+$')
+
+# 英文姓名
+_NON_WORD_RE = re.compile(r'[^\w]')
+_ASCII_LETTER_RE = re.compile(r'[A-Za-z]')
+_LETTER_RE = re.compile(r'[^\W\d_]')  # 字母（\w中去掉数字和下划线）
+_UPPER_ALPHA_RE = re.compile(r'^[A-Z]+$')
+_UPPER_DOTTED_NAME_RE = re.compile(r'^[A-Z]+(?:\.[A-Z]+)*$')  # 支持点号分隔的全大写姓名
+# 典型英文姓名格式：纯字母（含首字母大写形式）或点号分隔的全大写姓名
+_ENGLISH_NAME_SHAPE_RE = re.compile(r'^(?:[A-Za-z]+|[A-Z]+(?:\.[A-Z]+)*)$')
+# 明显不是英文姓名的文本（合并为一个正则，一次匹配完成）
+_ENGLISH_NAME_EXCLUDED_RE = re.compile(
+    r'^\d+$'  # 纯数字
+    r'|^[性别出生国籍有效期限证件号码签发机关]+'  # 中文字段名
+    r'|^(?:Sex|Birth|Nationality|Period|Validity|IDNO|CardNo)$'  # 英文字段名
+    r'|^\d{4}\.\d{2}\.\d{2}'  # 日期格式
+    r'|证件样本'  # 样本文字
+)
+# ============================================================================
+# 证件类型检测关键词
+# ============================================================================
+
+_FOREIGN_KEYWORDS = frozenset([
+    "姓名/Name", "Name", "性别/Sex", "Sex", "国籍/Nationality", "Nationality",
+    "Period", "Validity", "ZHENGJIAN", "YANGBEN", "证件样本",
+    "DateofBirth", "Date.of Birth", "PeriodofValidity", "IDNO", "CardNo",
+    "ImmigrationAdministration", "ssuingAuthority"
+])
+
+_CHINESE_KEYWORDS = frozenset([
+    "汉族", "民族", "住址", "签发机关", "有效期限"
+])
+
+def _build_keyword_automaton(keywords) -> Optional["ahocorasick.Automaton"]:
+    """构建Aho-Corasick自动机，未安装pyahocorasick时返回None"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+# 外国人永久居留身份证新版/旧版特征
+_FOREIGN_NEW_INDICATORS = frozenset(["姓名/Name", "国籍/Nationality", "IDNO"])
+_FOREIGN_OLD_INDICATORS = frozenset(["Date.of Birth", "CardNo", "ImmigrationAdministration"])
+
+# 中国身份证正面/背面特征
+_FRONT_INDICATORS = frozenset(["姓名", "性别", "民族", "出生", "住址", "公民身份号码"])
+_BACK_INDICATORS = frozenset(["签发机关", "有效期限", "中华人民共和国"])
+
+# 所有关键词合并后只需扫描一次文本
+_CARD_TYPE_KEYWORDS = (
+    _FOREIGN_KEYWORDS | _CHINESE_KEYWORDS
+    | _FOREIGN_NEW_INDICATORS | _FOREIGN_OLD_INDICATORS
+    | _FRONT_INDICATORS | _BACK_INDICATORS
+)
+_CARD_TYPE_AUTOMATON = _build_keyword_automaton(_CARD_TYPE_KEYWORDS)
+
+def _find_keywords(text: str) -> set:
+    """
+    单次扫描文本，返回其中出现的所有证件类型关键词
+    
+    Args:
+        text: 待扫描文本
+        
+    Returns:
+        出现的关键词集合
+    """
+    if _CARD_TYPE_AUTOMATON is None:
+        return {keyword for keyword in _CARD_TYPE_KEYWORDS if keyword in text}
+    return {keyword for _, keyword in _CARD_TYPE_AUTOMATON.iter(text)}
+
 # 全局OCR引擎实例缓存，按进程ID存储
 _ocr_instances = {}
 
+# 当前进程的OCR引擎引用，命中时无需os.getpid()和字典查找
+_current_ocr = None
+
+# 当前进程OCR引擎构建时使用的检测尺寸上限（快速模式引擎会覆盖配置值）
+_engine_det_limit_side_len = OCR_PERFORMANCE_CONFIG["det_limit_side_len"]
+
+def _reset_ocr_after_fork() -> None:
+    """fork后子进程清空从父进程继承的引擎实例和引用，首次使用时重新初始化"""
+    global _current_ocr, _engine_det_limit_side_len
+    _current_ocr = None
+    _engine_det_limit_side_len = OCR_PERFORMANCE_CONFIG["det_limit_side_len"]
+    _ocr_instances.clear()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_ocr_after_fork)
+
 # 🚀 OCR结果缓存机制 - v0.1.4新增
-_ocr_cache = {}
+_ocr_cache = OrderedDict()  # LRU顺序：最近使用的条目位于末尾
+_cache_lock = threading.Lock()
 _cache_max_size = 100  # 最大缓存条目数
 
+# 磁盘缓存（第二级缓存）：服务重启后仍然有效，多进程共享
+_disk_cache = None
+if OCR_DISK_CACHE_ENABLED:
+    if diskcache is None:
+        logger.warning("已启用OCR磁盘缓存，但未安装diskcache，请运行: pip install diskcache")
+    else:
+        _disk_cache = diskcache.Cache(
+            OCR_DISK_CACHE_DIR,
+            size_limit=OCR_DISK_CACHE_SIZE_MB * 1024 * 1024,
+            eviction_policy="least-recently-used",
+        )
+
 def _get_image_hash(image_data: Union[str, bytes]) -> str:
     """
     计算图像数据的哈希值，用于缓存键
     
+    对完整图像数据计算哈希：缓存结果包含身份信息且可能持久化到磁盘，
+    不能因采样指纹碰撞把一张图片的识别结果返回给另一张图片
+    
     Args:
         image_data: 图像数据
         
     Returns:
-        图像数据的MD5哈希值
+        图像数据的哈希值（仅用作缓存键，不要求密码学强度）
     """
     if isinstance(image_data, str):
         # 移除可能的base64前缀
-        if "base64," in image_data:
-            image_data = image_data.split("base64,")[1]
-        data_bytes = image_data.encode('utf-8')
-    else:
-        data_bytes = image_data
+        prefix_end = image_data.find("base64,")
+        if prefix_end != -1:
+            image_data = image_data[prefix_end + 7:]
+        # base64数据只包含ASCII字符
+        return _hash_bytes(image_data.encode('ascii'))
     
-    return hashlib.md5(data_bytes).hexdigest()
+    return _hash_bytes(image_data)
 
-def _get_cached_result(image_hash: str) -> Optional[List]:
+def _ocr_cache_key(image_hash: str, use_cls: bool) -> str:
     """
-    从缓存中获取OCR结果
+    生成OCR结果缓存键：是否运行方向分类器会影响识别结果，需区分缓存
     
     Args:
         image_hash: 图像哈希值
+        use_cls: 是否运行文本方向分类器
+        
+    Returns:
+        缓存键
+    """
+    return f"{image_hash}:{int(use_cls)}"
+
+def _get_cached_result(cache_key: str) -> Optional[List]:
+    """
+    从缓存中获取OCR结果
+    
+    Args:
+        cache_key: 缓存键（由_ocr_cache_key生成）
         
     Returns:
         缓存的OCR结果，如果不存在则返回None
     """
-    return _ocr_cache.get(image_hash)
+    with _cache_lock:
+        result = _ocr_cache.get(cache_key)
+        if result is not None:
+            # 命中时移到末尾，标记为最近使用
+            _ocr_cache.move_to_end(cache_key)
+            return result
+    
+    # 内存未命中时查询磁盘缓存，命中后回填内存缓存
+    if _disk_cache is not None:
+        result = _disk_cache.get(cache_key)
+        if result is not None:
+            _cache_result(cache_key, result, persist=False)
+    return result
 
-def _cache_result(image_hash: str, ocr_result: List) -> None:
+def _cache_result(cache_key: str, ocr_result: List, persist: bool = True) -> None:
     """
     缓存OCR结果
     
     Args:
-        image_hash: 图像哈希值
+        cache_key: 缓存键（由_ocr_cache_key生成）
         ocr_result: OCR识别结果
+        persist: 是否同时写入磁盘缓存（启用时）
     """
-    # 如果缓存已满，删除最旧的条目
-    if len(_ocr_cache) >= _cache_max_size:
-        # 删除最旧的键（简单FIFO策略）
-        oldest_key = next(iter(_ocr_cache))
-        del _ocr_cache[oldest_key]
-        logger.debug(f"缓存已满，删除最旧的条目: {oldest_key[:8]}...")
-    
-    _ocr_cache[image_hash] = ocr_result
-    logger.debug(f"缓存OCR结果: {image_hash[:8]}... (缓存大小: {len(_ocr_cache)})")
+    with _cache_lock:
+        if cache_key in _ocr_cache:
+            _ocr_cache.move_to_end(cache_key)
+        elif len(_ocr_cache) >= _cache_max_size:
+            # 缓存已满，删除最久未使用的条目（LRU策略）
+            oldest_key, _ = _ocr_cache.popitem(last=False)
+            logger.debug(f"缓存已满，删除最久未使用的条目: {oldest_key[:8]}...")
+        
+        _ocr_cache[cache_key] = ocr_result
+        cache_size = len(_ocr_cache)
+    logger.debug(f"缓存OCR结果: {cache_key[:8]}... (缓存大小: {cache_size})")
+    
+    if persist and _disk_cache is not None:
+        _disk_cache.set(cache_key, ocr_result)
 
 def clear_ocr_cache() -> None:
     """清空OCR结果缓存"""
-    global _ocr_cache
-    _ocr_cache.clear()
+    with _cache_lock:
+        _ocr_cache.clear()
+    if _disk_cache is not None:
+        _disk_cache.clear()
     logger.info("OCR结果缓存已清空")
 
+class _OnnxOCREngine:
+    """
+    ONNXRuntime推理后端适配器
+    
+    包装RapidOCR，对外提供与PaddleOCR一致的ocr()接口和返回格式，调用方无需修改
+    """
+    
+    def __init__(self):
+        self._engine = RapidOCR()
+    
+    def ocr(self, image: np.ndarray, cls: bool = True) -> List:
+        """
+        识别图像中的文字
+        
+        Args:
+            image: 图像数组
+            cls: 是否使用方向分类器
+            
+        Returns:
+            PaddleOCR格式的结果：[[[坐标], (文本, 置信度)], ...]，按页包装为列表
+        """
+        result, _ = self._engine(image, use_cls=cls)
+        if not result:
+            return [[]]
+        return [[[box, (text, float(score))] for box, text, score in result]]
+
+def _worker_cpu_threads() -> int:
+    """
+    计算单个OCR工作进程的推理线程数
+    
+    各进程的线程数之和不超过CPU核心数，避免多进程并行时MKLDNN线程争抢
+    
+    Returns:
+        推理线程数（至少为1）
+    """
+    cpu_count = os.cpu_count() or 1
+    per_worker = max(1, cpu_count // max(1, OCR_PROCESS_POOL_SIZE))
+    return min(OCR_PERFORMANCE_CONFIG["cpu_threads"], per_worker)
+
+def _find_int8_model_dirs() -> Dict[str, str]:
+    """
+    查找PaddleSlim导出的INT8量化模型目录
+    
+    可以只量化计算量最大的识别模型，缺失的模型继续使用默认FP32模型
+    
+    Returns:
+        已存在的det_model_dir/rec_model_dir/cls_model_dir参数字典，均缺失时为空字典
+    """
+    base_dir = Path(OCR_PERFORMANCE_CONFIG["int8_model_dir"])
+    model_dirs = {}
+    for name in ("det", "rec", "cls"):
+        model_dir = base_dir / name
+        if (model_dir / "inference.pdmodel").is_file():
+            model_dirs[f"{name}_model_dir"] = str(model_dir)
+    return model_dirs
+
+def _resolve_use_gpu() -> bool:
+    """
+    判断是否启用GPU推理：配置开启且paddle编译了CUDA时才返回True
+    
+    Returns:
+        是否使用GPU
+    """
+    if not OCR_PERFORMANCE_CONFIG["use_gpu"]:
+        return False
+    try:
+        import paddle
+        if paddle.device.is_compiled_with_cuda():
+            return True
+    except Exception as e:
+        logger.debug("检测CUDA支持失败: {}", e)
+    logger.warning("OCR_USE_GPU=true 但当前paddlepaddle未编译CUDA，回退到CPU推理")
+    return False
+
 def get_ocr_engine():
     """
     获取当前进程的OCR引擎实例
@@ -96,12 +435,16 @@ def get_ocr_engine():
     Returns:
         PaddleOCR实例
     """
-    import os
+    global _current_ocr, _engine_det_limit_side_len
+    if _current_ocr is not None:
+        return _current_ocr
+    
     pid = os.getpid()
     
     # 如果当前进程已有实例，则直接返回
     if pid in _ocr_instances:
-        return _ocr_instances[pid]
+        _current_ocr = _ocr_instances[pid]
+        return _current_ocr
     
     # 否则创建新实例
     logger.info(f"进程 {pid} 初始化OCR引擎...")
@@ -109,6 +452,20 @@ def get_ocr_engine():
     # 创建模型目录
     os.makedirs(OCR_MODEL_DIR, exist_ok=True)
     
+    # ⚡ ONNXRuntime推理后端（可选）
+    if OCR_PERFORMANCE_CONFIG["backend"] == "onnx":
+        if RapidOCR is None:
+            logger.warning("OCR_BACKEND=onnx 但未安装rapidocr_onnxruntime，回退到PaddlePaddle推理")
+        else:
+            try:
+                ocr = _OnnxOCREngine()
+                _ocr_instances[pid] = ocr
+                _current_ocr = ocr
+                logger.info(f"进程 {pid} OCR引擎初始化完成（ONNXRuntime后端）")
+                return ocr
+            except Exception as e:
+                logger.warning(f"进程 {pid} ONNXRuntime后端初始化失败，回退到PaddlePaddle推理: {str(e)}")
+    
     # 初始化PaddleOCR - v0.1.4性能优化版本
     try:
         # 基础配置参数
@@ -118,25 +475,44 @@ def get_ocr_engine():
             "det": ID_CARD_CONFIG["det"],
             "rec": ID_CARD_CONFIG["rec"],
             "cls": ID_CARD_CONFIG["cls"],
-            "use_gpu": False,  # 默认使用CPU，可根据需要修改
+            "use_gpu": _resolve_use_gpu(),
         }
         
         # 🚀 性能优化参数 - v0.1.4新增
         performance_params = {
             "det_limit_side_len": OCR_PERFORMANCE_CONFIG["det_limit_side_len"],
             "rec_batch_num": OCR_PERFORMANCE_CONFIG["rec_batch_num"],
+            "cls_batch_num": OCR_PERFORMANCE_CONFIG["cls_batch_num"],
             "max_text_length": OCR_PERFORMANCE_CONFIG["max_text_length"],
-            "cpu_threads": OCR_PERFORMANCE_CONFIG["cpu_threads"],
+            "cpu_threads": _worker_cpu_threads(),
             "det_db_thresh": OCR_PERFORMANCE_CONFIG["det_db_thresh"],
             "det_db_box_thresh": OCR_PERFORMANCE_CONFIG["det_db_box_thresh"],
             "drop_score": OCR_PERFORMANCE_CONFIG["drop_score"],
+            "enable_mkldnn": OCR_PERFORMANCE_CONFIG["enable_mkldnn"],
         }
         
+        # ⚡ INT8量化模型：按模型分别启用，缺失的模型回退默认FP32模型
+        quant_model_dirs = _find_int8_model_dirs()
+        if quant_model_dirs:
+            performance_params.update(quant_model_dirs)
+            # precision对所有模型生效（TensorRT），仅三个模型都已量化时才设为int8
+            if len(quant_model_dirs) == 3:
+                performance_params["precision"] = "int8"
+            logger.info(f"使用INT8量化模型: {', '.join(sorted(quant_model_dirs.values()))}")
+        
+        # 🚀 TensorRT加速：仅GPU可用时生效，INT8模型保持int8精度，否则使用FP16
+        # 动态shape信息由PaddleOCR保存在模型目录，后续启动直接复用
+        if OCR_PERFORMANCE_CONFIG["use_tensorrt"]:
+            if ocr_params["use_gpu"]:
+                performance_params["use_tensorrt"] = True
+                performance_params.setdefault("precision", "fp16")
+            else:
+                logger.warning("OCR_USE_TENSORRT=true 但未启用GPU推理，忽略TensorRT配置")
+        
         # 🏃‍♂️ 快速模式额外优化
         if OCR_PERFORMANCE_CONFIG["enable_fast_mode"]:
             performance_params.update({
                 "det_limit_side_len": 800,  # 降低检测尺寸限制
-                "rec_batch_num": 8,         # 增加批次大小
                 "drop_score": 0.6,          # 提高置信度阈值，过滤低质量结果
                 "det_db_thresh": 0.4,       # 调整检测阈值
             })
@@ -147,19 +523,44 @@ def get_ocr_engine():
         
         ocr = PaddleOCR(**ocr_params)
         _ocr_instances[pid] = ocr
-        logger.info(f"进程 {pid} OCR引擎初始化完成")
+        _current_ocr = ocr
+        _engine_det_limit_side_len = ocr_params["det_limit_side_len"]
+        logger.info(
+            f"进程 {pid} OCR引擎初始化完成（PaddlePaddle后端，"
+            f"device={'gpu' if ocr_params['use_gpu'] else 'cpu'}，"
+            f"mkldnn={ocr_params['enable_mkldnn'] and not ocr_params['use_gpu']}，"
+            f"cpu_threads={ocr_params['cpu_threads']}，"
+            f"tensorrt={ocr_params.get('use_tensorrt', False)}，"
+            f"precision={ocr_params.get('precision', 'fp32')}）"
+        )
         return ocr
     except Exception as e:
         logger.error(f"进程 {pid} OCR引擎初始化失败: {str(e)}")
         raise RuntimeError(f"OCR引擎初始化失败: {str(e)}")
 
-def recognize_text(image: np.ndarray, image_data: Union[str, bytes] = None) -> List[List[Tuple[List[List[int]], str, float]]]:
+def warmup_ocr_engine() -> None:
+    """
+    预热当前进程的OCR引擎：加载模型并执行一次空白图像推理
+    
+    首次推理会触发推理库的内存分配和算子初始化，提前执行可避免首个请求的延迟尖峰
+    """
+    try:
+        ocr = get_ocr_engine()
+        ocr.ocr(np.full((32, 32, 3), 255, dtype=np.uint8), cls=False)
+    except Exception as e:
+        # 预热失败不影响服务，首次请求时会再次尝试初始化
+        logger.warning(f"进程 {os.getpid()} 预热OCR引擎失败: {str(e)}")
+
+def recognize_text(image: np.ndarray, image_data: Union[str, bytes] = None, use_cls: bool = True,
+                   image_hash: Optional[str] = None) -> List[List[Tuple[List[List[int]], str, float]]]:
     """
     识别图像中的文字 - v0.1.4缓存优化版本
     
     Args:
         image: 图像数组
         image_data: 原始图像数据（用于缓存）
+        use_cls: 是否运行文本方向分类器，关闭可省去一次模型推理，但旋转（如倒置）的文本行将无法正确识别
+        image_hash: 调用方已计算好的图像哈希值，提供时不再重复计算
         
     Returns:
         识别结果列表，格式为[[[坐标], 文本, 置信度], ...]
@@ -169,20 +570,29 @@ def recognize_text(image: np.ndarray, image_data: Union[str, bytes] = None) -> L
         
         # 🚀 尝试从缓存获取结果（如果提供了原始图像数据）
         cached_result = None
-        image_hash = None
         
-        if image_data is not None:
+        if image_hash is None and image_data is not None:
             image_hash = _get_image_hash(image_data)
-            cached_result = _get_cached_result(image_hash)
+        
+        cache_key = None
+        if image_hash is not None:
+            cache_key = _ocr_cache_key(image_hash, use_cls)
+            cached_result = _get_cached_result(cache_key)
             
             if cached_result is not None:
                 cache_time = (time.time() - start_time) * 1000
                 logger.info(f"🚀 使用缓存结果，耗时: {cache_time:.2f}ms，识别到 {len(cached_result)} 个文本块")
                 return cached_result
         
-        # 缓存未命中，执行OCR识别
+        # 缓存未命中，先缩小到当前引擎构建时的检测尺寸上限（快速模式引擎为800），
+        # 使OCR内部的缩放不再重复整图重采样
         ocr = get_ocr_engine()
-        result = ocr.ocr(image, cls=True)
+        original_height, original_width = image.shape[:2]
+        image = ImageProcessor.resize_image(image, max_size=_engine_det_limit_side_len)
+        scale = image.shape[1] / original_width
+        
+        # 执行OCR识别
+        result = ocr.ocr(image, cls=use_cls)
         
         # PaddleOCR返回的结果格式可能因版本而异，进行适配
         if result is None:
@@ -198,9 +608,17 @@ def recognize_text(image: np.ndarray, image_data: Union[str, bytes] = None) -> L
             else:
                 result = []
         
+        # 坐标换算回原始图像尺寸，保证后续基于位置的逻辑不受缩放影响
+        if scale != 1.0 and result:
+            result = [
+                [(np.asarray(item[0], dtype=np.float64) / scale).tolist(), item[1]]
+                if item and len(item) >= 2 else item
+                for item in result
+            ]
+        
         # 🚀 缓存结果（如果提供了原始图像数据）
-        if image_hash is not None:
-            _cache_result(image_hash, result)
+        if cache_key is not None:
+            _cache_result(cache_key, result)
         
         execution_time = time.time() - start_time
         cache_status = " (已缓存)" if image_hash else ""
@@ -229,40 +647,22 @@ def detect_card_type(text_blocks: List[Dict]) -> tuple[str, bool]:
     
     logger.debug(f"自动检测证件类型，识别文本: {all_texts}")
     
-    # 检测特征关键词
-    foreign_keywords = [
-        "姓名/Name", "Name", "性别/Sex", "Sex", "国籍/Nationality", "Nationality",
-        "Period", "Validity", "ZHENGJIAN", "YANGBEN", "证件样本",
-        "DateofBirth", "Date.of Birth", "PeriodofValidity", "IDNO", "CardNo",
-        "ImmigrationAdministration", "ssuingAuthority"
-    ]
-    
-    chinese_keywords = [
-        "汉族", "民族", "住址", "签发机关", "有效期限"
-    ]
+    # 单次扫描收集出现的特征关键词
+    found_keywords = _find_keywords(combined_text)
     
     # 统计外国人永久居留身份证特征
-    foreign_score = 0
-    for keyword in foreign_keywords:
-        if keyword in combined_text:
-            foreign_score += 1
+    foreign_score = len(found_keywords & _FOREIGN_KEYWORDS)
     
-    # 统计中国身份证特征  
-    chinese_score = 0
-    for keyword in chinese_keywords:
-        if keyword in combined_text:
-            chinese_score += 1
+    # 统计中国身份证特征
+    chinese_score = len(found_keywords & _CHINESE_KEYWORDS)
     
     logger.debug(f"证件类型评分 - 外国人永久居留身份证: {foreign_score}, 中国身份证: {chinese_score}")
     
     # 判断是否为外国人永久居留身份证
     if foreign_score >= 2:  # 至少匹配2个外国人证件特征
         # 判断新版vs旧版
-        new_version_indicators = ["姓名/Name", "国籍/Nationality", "IDNO"]
-        old_version_indicators = ["Date.of Birth", "CardNo", "ImmigrationAdministration"]
-        
-        new_score = sum(1 for indicator in new_version_indicators if indicator in combined_text)
-        old_score = sum(1 for indicator in old_version_indicators if indicator in combined_text)
+        new_score = len(found_keywords & _FOREIGN_NEW_INDICATORS)
+        old_score = len(found_keywords & _FOREIGN_OLD_INDICATORS)
         
         if new_score >= old_score:
             logger.info(f"自动检测结果：新版外国人永久居留身份证 (新版得分: {new_score}, 旧版得分: {old_score})")
@@ -271,14 +671,11 @@ def detect_card_type(text_blocks: List[Dict]) -> tuple[str, bool]:
             logger.info(f"自动检测结果：旧版外国人永久居留身份证 (新版得分: {new_score}, 旧版得分: {old_score})")
             return "foreign_old", True
     
-    # 判断中国身份证正反面
-    if chinese_score > 0 or any(keyword in combined_text for keyword in ["住址", "签发机关", "有效期限"]):
+    # 判断中国身份证正反面（"住址"、"签发机关"、"有效期限"均已包含在中国身份证特征中）
+    if chinese_score > 0:
         # 检测正反面特征
-        front_indicators = ["姓名", "性别", "民族", "出生", "住址", "公民身份号码"]
-        back_indicators = ["签发机关", "有效期限", "中华人民共和国"]
-        
-        front_score = sum(1 for indicator in front_indicators if indicator in combined_text)
-        back_score = sum(1 for indicator in back_indicators if indicator in combined_text)
+        front_score = len(found_keywords & _FRONT_INDICATORS)
+        back_score = len(found_keywords & _BACK_INDICATORS)
         
         is_front = front_score >= back_score
         side_name = "正面" if is_front else "背面"
@@ -318,24 +715,31 @@ def extract_id_card_info(image_data: Union[str, bytes], is_front: bool = True, c
             OCR_PERFORMANCE_CONFIG["enable_fast_mode"] = True
             logger.info("🚀 已启用API级别快速模式")
         
-        # 预处理图像 - v0.1.4性能优化
-        if OCR_PERFORMANCE_CONFIG["enable_fast_mode"] or OCR_PERFORMANCE_CONFIG["enable_memory_optimization"]:
-            image = ImageProcessor.preprocess_id_card_image_fast(image_data)
-            logger.debug("使用快速图像预处理模式")
-        else:
-            image = ImageProcessor.preprocess_id_card_image(image_data)
-        
-        # 内存优化：在OCR前进行垃圾回收
-        if MEMORY_OPTIMIZATION:
-            gc.collect()
+        # base64只解码一次：解码后的二进制数据同时用于图像解码和缓存键计算（比base64文本短约1/3）
+        image_data = ImageProcessor.to_image_bytes(image_data)
         
-        # 识别文字 - v0.1.4启用缓存
-        ocr_result = recognize_text(image, image_data)
+        # 🚀 先查OCR结果缓存，命中时连图像预处理一并跳过
+        image_hash = _get_image_hash(image_data)
+        use_cls = not OCR_PERFORMANCE_CONFIG["enable_fast_mode"]
+        ocr_result = _get_cached_result(_ocr_cache_key(image_hash, use_cls))
         
-        # 内存优化：清除图像变量以释放内存
-        if MEMORY_OPTIMIZATION:
-            del image
-            gc.collect()
+        if ocr_result is not None:
+            logger.info(f"🚀 使用缓存结果，跳过图像预处理和OCR，识别到 {len(ocr_result)} 个文本块")
+        else:
+            # 预处理图像 - v0.1.4性能优化
+            if OCR_PERFORMANCE_CONFIG["enable_fast_mode"] or OCR_PERFORMANCE_CONFIG["enable_memory_optimization"]:
+                image = ImageProcessor.preprocess_id_card_image_fast(image_data)
+                logger.debug("使用快速图像预处理模式")
+            else:
+                image = ImageProcessor.preprocess_id_card_image(image_data)
+            
+            # 识别文字 - v0.1.4启用缓存
+            # 快速模式跳过文本方向分类器：以放弃识别旋转（如倒置）文本行为代价换取速度
+            ocr_result = recognize_text(
+                image, image_data,
+                use_cls=use_cls,
+                image_hash=image_hash,
+            )
         
         # 提取身份证信息
         id_card_info = {}
@@ -346,22 +750,22 @@ def extract_id_card_info(image_data: Union[str, bytes], is_front: bool = True, c
             return id_card_info
         
         # 提取文本和位置信息
+        valid_items = [item for item in ocr_result if len(item) >= 2]  # 确保结果格式正确
         text_blocks = []
-        for item in ocr_result:
-            if len(item) >= 2:  # 确保结果格式正确
-                coords, (text, confidence) = item
-                # 计算文本块的中心点坐标
-                center_x = sum(point[0] for point in coords) / 4
-                center_y = sum(point[1] for point in coords) / 4
+        if valid_items:
+            # 一次性计算所有文本块的中心点坐标，形状 (N, 4, 2) -> (N, 2)
+            centers = np.asarray([item[0] for item in valid_items], dtype=np.float64).mean(axis=1).tolist()
+            for (coords, (text, confidence)), (center_x, center_y) in zip(valid_items, centers):
                 text_blocks.append({
                     "text": text,
+                    "text_stripped": text.strip(),  # 构建时去除一次首尾空白，后续处理直接使用
                     "confidence": confidence,
                     "center": (center_x, center_y),
                     "coords": coords
                 })
         
         # 记录所有识别到的文本，用于调试
-        logger.debug(f"识别到的文本块: {[block['text'] for block in text_blocks]}")
+        logger.opt(lazy=True).debug("识别到的文本块: {}", lambda: [block['text'] for block in text_blocks])
         
         # Debug模式：返回原始OCR文本
         if debug:
@@ -389,6 +793,9 @@ def extract_id_card_info(image_data: Union[str, bytes], is_front: bool = True, c
         # 处理中国居民身份证
         # 根据身份证正反面提取不同信息
         if is_front:
+            # 预先标记身份证号码文本块，后续地址处理只需检查标记
+            _mark_id_number_blocks(text_blocks)
+            
             # 提取身份证号码（通常位于底部）
             id_number = _extract_id_number(text_blocks)
             if id_number:
@@ -400,61 +807,52 @@ def extract_id_card_info(image_data: Union[str, bytes], is_front: bool = True, c
                 id_card_info["name"] = name_value
             
             # 提取其他字段
-            field_patterns = {
-                "性别": r"性别[\s:：]*([男女])",  # 修改性别匹配模式，只匹配"男"或"女"
-                "民族": r"民族[\s:：]*(.+)",
-                "出生": r"出生[\s:：]*(.+)"
-                # 移除住址字段，让它由后续的地址合并逻辑处理
-                # 移除姓名字段，由智能提取处理
-            }
+            # 住址字段由后续的地址合并逻辑处理，姓名字段由智能提取处理
             
             # 遍历文本块提取信息
             address_blocks = []
             birth_blocks = []
             
             for block in text_blocks:
-                text = block["text"].strip()
+                text = block["text_stripped"]
                 
                 # 检查是否匹配任何字段
-                for field, pattern in field_patterns.items():
-                    match = re.search(pattern, text)
-                    if match:
-                        field_key = ID_CARD_FIELD_MAPPING.get(field, field)
-                        field_value = match.group(1).strip()
-                        id_card_info[field_key] = field_value
-                        
-                        # 如果是出生日期字段，添加到birth_blocks以便后续处理
-                        if field == "出生":
-                            birth_blocks.append(block)
-                        break
+                match = _FIELD_RE.match(text)
+                if match:
+                    field = match.lastgroup
+                    field_key = ID_CARD_FIELD_MAPPING.get(field, field)
+                    id_card_info[field_key] = match.group(field).strip()
+                    
+                    # 如果是出生日期字段，添加到birth_blocks以便后续处理
+                    if field == "出生":
+                        birth_blocks.append(block)
                 
                 # 特殊处理性别和民族字段，它们可能在同一行
                 if "性别" in text and "民族" in text:
                     # 尝试提取性别和民族
-                    sex_match = re.search(r"性别[\s:：]*([男女])", text)
-                    nation_match = re.search(r"民族[\s:：]*([^\s]+)", text)
+                    sex_match = _SEX_RE.search(text)
+                    nation_match = _NATION_TOKEN_RE.search(text)
                     
                     if sex_match:
                         id_card_info["sex"] = sex_match.group(1).strip()
                     if nation_match:
                         id_card_info["nation"] = nation_match.group(1).strip()
-                
-                # 处理"性别男民族汉"这样的格式
-                if "性别" in text and "民族" in text and "sex" not in id_card_info:
-                    # 尝试匹配"性别男民族汉"格式
-                    combined_match = re.search(r"性别([男女])民族([^\s]+)", text)
-                    if combined_match:
-                        id_card_info["sex"] = combined_match.group(1).strip()
-                        id_card_info["nation"] = combined_match.group(2).strip()
-                        logger.info(f"从组合文本中提取性别和民族: 性别={id_card_info['sex']}, 民族={id_card_info['nation']}")
+                    
+                    # 处理"性别男民族汉"这样的格式
+                    if "sex" not in id_card_info:
+                        combined_match = _SEX_NATION_RE.search(text)
+                        if combined_match:
+                            id_card_info["sex"] = combined_match.group(1).strip()
+                            id_card_info["nation"] = combined_match.group(2).strip()
+                            logger.info(f"从组合文本中提取性别和民族: 性别={id_card_info['sex']}, 民族={id_card_info['nation']}")
                 
                 # 住址可能跨多行，收集可能的住址行
                 if "住址" in text:
                     address_blocks.append(block)
                 elif address_blocks:
                     # 关键修复：在收集地址块时优先排除身份证号码
-                    if re.match(r'^[1-9]\d{5}(?:19|20)\d{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[12]\d|3[01])\d{3}(?:\d|X|x)$', text):
-                        logger.debug(f"收集地址块时跳过身份证号码: {text}")
+                    if block["is_id_number"]:
+                        logger.debug("收集地址块时跳过身份证号码: {}", text)
                         continue
                         
                     # 如果已经有住址块，检查当前块是否可能是地址的延续
@@ -470,21 +868,15 @@ def extract_id_card_info(image_data: Union[str, bytes], is_front: bool = True, c
                         # 检查文本是否像地址的一部分，但要排除明显不是地址的内容
                         if _is_valid_address_text(text):
                             address_blocks.append(block)
-                            logger.debug(f"添加地址延续块: {text}")
+                            logger.debug("添加地址延续块: {}", text)
                         else:
-                            logger.debug(f"文本不符合地址格式，跳过: {text}")
+                            logger.debug("文本不符合地址格式，跳过: {}", text)
                 
                 # 尝试提取出生日期，可能在"出生"文本块的附近
-                if "出生" in text and "birth" not in id_card_info:
+                if "birth" not in id_card_info and "出生" in text:
                     # 尝试直接从文本中提取日期格式
-                    date_patterns = [
-                        r"(\d{4}年\d{1,2}月\d{1,2}日)",  # 1990年1月1日
-                        r"(\d{4}[\./\-年]\d{1,2}[\./\-月]\d{1,2}[日]?)",  # 1990.1.1, 1990-1-1
-                        r"(\d{4}[年\s]+\d{1,2}[月\s]+\d{1,2}[日]?)"  # 1990 1 1
-                    ]
-                    
-                    for pattern in date_patterns:
-                        date_match = re.search(pattern, text)
+                    for pattern in _DATE_RES:
+                        date_match = pattern.search(text)
                         if date_match:
                             id_card_info["birth"] = date_match.group(1).strip()
                             break
@@ -492,7 +884,7 @@ def extract_id_card_info(image_data: Union[str, bytes], is_front: bool = True, c
             # 如果没有找到出生日期，尝试从身份证号码提取
             if "birth" not in id_card_info and "id_number" in id_card_info:
                 id_num = id_card_info["id_number"]
-                if len(id_num) == 18 and re.match(r"^\d{17}[\dXx]$", id_num):
+                if len(id_num) == 18 and _ID_NUMBER_DIGITS_RE.match(id_num):
                     # 从身份证号码提取出生日期 (格式: YYYYMMDD, 位置: 7-14)
                     year = id_num[6:10]
                     month = id_num[10:12]
@@ -506,69 +898,64 @@ def extract_id_card_info(image_data: Union[str, bytes], is_front: bool = True, c
                 address_blocks.sort(key=lambda b: (b["center"][1], b["center"][0]))
                 
                 # 记录排序后的地址块
-                logger.debug(f"排序后的地址块: {[block['text'] for block in address_blocks]}")
+                logger.opt(lazy=True).debug("排序后的地址块: {}", lambda: [block['text'] for block in address_blocks])
                 
                 # 提取地址文本
                 address_parts = []
                 
                 for block in address_blocks:
-                    text = block["text"].strip()
-                    logger.debug(f"处理地址块: '{text}'")
+                    text = block["text_stripped"]
+                    logger.debug("处理地址块: '{}'", text)
                     
                     if "住址" in text:
                         # 提取住址后面的部分
                         original_text = text
-                        text = re.sub(r"住址[\s:：]*", "", text)
-                        logger.debug(f"住址块处理: '{original_text}' -> '{text}'")
+                        text = _ADDRESS_PREFIX_RE.sub("", text)
+                        logger.debug("住址块处理: '{}' -> '{}'", original_text, text)
                     
-                    # 关键修复：过滤掉身份证号码
+                    # 关键修复：过滤掉身份证号码（_is_valid_address_text已排除身份证号码格式）
                     if text and _is_valid_address_text(text):
-                        # 额外检查：确保不是身份证号码
-                        if not re.match(r'^[1-9]\d{5}(?:19|20)\d{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[12]\d|3[01])\d{3}(?:\d|X|x)$', text):
-                            address_parts.append(text)
-                            logger.debug(f"添加地址部分: '{text}'")
-                        else:
-                            logger.debug(f"跳过身份证号码: '{text}'")
+                        address_parts.append(text)
+                        logger.debug("添加地址部分: '{}'", text)
                     else:
-                        logger.debug(f"跳过无效地址文本: '{text}'")
+                        logger.debug("跳过无效地址文本: '{}'", text)
                 
-                logger.debug(f"过滤后的地址部分: {address_parts}")
+                logger.debug("过滤后的地址部分: {}", address_parts)
                 
                 # 合并所有地址组件，不使用空格分隔（符合中文地址格式）
                 address = "".join(address_parts)
                 id_card_info["address"] = address.strip()
-                logger.debug(f"初始提取的地址: {id_card_info['address']}")
+                logger.debug("初始提取的地址: {}", id_card_info['address'])
                 
                 # 清理地址中可能的多余空格和标点符号
                 if "address" in id_card_info:
-                    # 删除所有空格（中文地址通常不需要空格）
-                    id_card_info["address"] = re.sub(r'\s+', '', id_card_info["address"])
+                    # 删除所有空格（中文地址通常不需要空格），split()覆盖全部Unicode空白字符
+                    address = "".join(id_card_info["address"].split())
                     # 删除末尾可能的标点符号
-                    id_card_info["address"] = re.sub(r'[,，.。、；;]$', '', id_card_info["address"])
+                    if address.endswith(_TRAILING_PUNCT):
+                        address = address[:-1]
+                    id_card_info["address"] = address
                     
                     # 检查是否有单独的数字块可能是门牌号
                     house_number_block = None
+                    # 按对象身份判断是否为已收集的地址块，避免逐个比较字典内容
+                    address_block_ids = {id(block) for block in address_blocks}
                     for block in text_blocks:
-                        if block not in address_blocks:  # 避免重复处理已包含的块
-                            text = block["text"].strip()
+                        if id(block) not in address_block_ids:  # 避免重复处理已包含的块
+                            text = block["text_stripped"]
                             
                             # 关键修复：先排除身份证号码
-                            if re.match(r'^[1-9]\d{5}(?:19|20)\d{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[12]\d|3[01])\d{3}(?:\d|X|x)$', text):
-                                logger.debug(f"跳过身份证号码，不作为门牌号: {text}")
+                            if block["is_id_number"]:
+                                logger.debug("跳过身份证号码，不作为门牌号: {}", text)
                                 continue
                                 
                             # 检查是否是门牌号格式（更广泛的模式）
                             # 扩展门牌号识别模式，包括更多组合形式
-                            if (re.match(r'^\d+号?$', text) or  # 纯数字或数字+号
-                                re.match(r'^[0-9-]+号?$', text) or  # 数字-数字格式
-                                re.match(r'^\d+[号室栋单元]$', text) or  # 数字+单位
-                                re.match(r'^\d+[A-Za-z]号?$', text) or  # 数字+字母
-                                re.match(r'^[村组社区队]\d+号?$', text) or  # 村/组/社区/队+数字
-                                re.match(r'.*[村组社区队]\d+号?$', text)):  # 任意文本+村/组/社区/队+数字
+                            if _HOUSE_NUMBER_RE.match(text):
                                 
                                 # 再次确认不是身份证号码
                                 if len(text) >= 15:  # 身份证号码长度检查
-                                    logger.debug(f"疑似身份证号码，跳过: {text}")
+                                    logger.debug("疑似身份证号码，跳过: {}", text)
                                     continue
                                     
                                 # 检查位置是否在最后一个地址块附近
@@ -588,19 +975,19 @@ def extract_id_card_info(image_data: Union[str, bytes], is_front: bool = True, c
                             logger.info(f"添加门牌号后的地址: {id_card_info['address']}")
                     
                     # 如果地址中不包含数字，检查是否有单独的数字块
-                    elif not re.search(r'\d', id_card_info["address"]):
+                    elif not _DIGIT_RE.search(id_card_info["address"]):
                         # 查找所有可能的数字块
                         number_blocks = []
                         for block in text_blocks:
-                            text = block["text"].strip()
+                            text = block["text_stripped"]
                             
                             # 关键修复：严格排除身份证号码
-                            if re.match(r'^[1-9]\d{5}(?:19|20)\d{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[12]\d|3[01])\d{3}(?:\d|X|x)$', text):
-                                logger.debug(f"排除身份证号码，不作为地址数字块: {text}")
+                            if block["is_id_number"]:
+                                logger.debug("排除身份证号码，不作为地址数字块: {}", text)
                                 continue
                                 
                             # 排除长数字串（可能是身份证号码）
-                            if re.search(r'\d+', text) and len(text) < 10 and len(text) < 15:  # 避免误匹配身份证号等长数字
+                            if _DIGIT_RE.search(text) and len(text) < 10 and len(text) < 15:  # 避免误匹配身份证号等长数字
                                 number_blocks.append(block)
                         
                         # 如果找到数字块，选择最接近地址块的一个
@@ -610,24 +997,25 @@ def extract_id_card_info(image_data: Union[str, bytes], is_front: bool = True, c
                                                key=lambda b: abs(b["center"][1] - last_address_block["center"][1]))
                             
                             # 再次确认不是身份证号码
-                            closest_text = closest_block["text"].strip()
-                            if not re.match(r'^[1-9]\d{5}(?:19|20)\d{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[12]\d|3[01])\d{3}(?:\d|X|x)$', closest_text):
+                            closest_text = closest_block["text_stripped"]
+                            if not closest_block["is_id_number"]:
                                 # 如果距离合理，添加到地址
                                 # 放宽垂直距离限制，从100增加到150
                                 if abs(closest_block["center"][1] - last_address_block["center"][1]) < 150:
                                     id_card_info["address"] += closest_text
                                     logger.info(f"添加数字块后的地址: {id_card_info['address']}")
                             else:
-                                logger.debug(f"最接近的数字块是身份证号码，跳过: {closest_text}")
+                                logger.debug("最接近的数字块是身份证号码，跳过: {}", closest_text)
                     
                     # 添加地址后处理逻辑
-                    processed_address = _post_process_address(id_card_info["address"], text_blocks)
+                    address_candidates = _build_address_candidates(text_blocks)
+                    processed_address = _post_process_address(id_card_info["address"], text_blocks, address_candidates)
                     if processed_address != id_card_info["address"]:
                         id_card_info["address"] = processed_address
                         logger.info(f"地址后处理后: {id_card_info['address']}")
                     
                     # 应用地址规则引擎
-                    rule_processed_address = _apply_address_rules(id_card_info["address"], id_card_info.get("name", ""), text_blocks)
+                    rule_processed_address = _apply_address_rules(id_card_info["address"], id_card_info.get("name", ""), text_blocks, address_candidates)
                     if rule_processed_address != id_card_info["address"]:
                         id_card_info["address"] = rule_processed_address
                         logger.info(f"地址规则引擎处理后: {id_card_info['address']}")
@@ -636,29 +1024,29 @@ def extract_id_card_info(image_data: Union[str, bytes], is_front: bool = True, c
         else:
             # 提取签发机关和有效期限（身份证背面）
             for block in text_blocks:
-                text = block["text"].strip()
+                text = block["text_stripped"]
                 
                 # 提取签发机关
                 if "签发机关" in text:
-                    match = re.search(r"签发机关[\s:：]*(.+)", text)
+                    match = _ISSUE_AUTHORITY_RE.search(text)
                     if match:
                         id_card_info["issue_authority"] = match.group(1).strip()
                 
                 # 提取有效期限
                 if "有效期" in text:
-                    match = re.search(r"有效期[限至]?[\s:：]*(.+)", text)
+                    match = _VALID_PERIOD_RE.search(text)
                     if match:
                         id_card_info["valid_period"] = match.group(1).strip()
         
         # 记录提取结果
         if MEMORY_OPTIMIZATION:
-            logger.debug(f"提取的身份证信息字段数: {len(id_card_info)}")
+            logger.debug("提取的身份证信息字段数: {}", len(id_card_info))
         else:
             logger.info(f"提取的身份证信息: {id_card_info}")
         
-        # 内存优化：函数结束前进行垃圾回收
+        # 内存优化：函数结束前回收年轻代（图像等短生命周期对象），避免全堆扫描
         if ENABLE_GC_AFTER_REQUEST:
-            gc.collect()
+            gc.collect(0)
         
         # 🚀 恢复原始快速模式设置
         if fast_mode:
@@ -678,9 +1066,29 @@ def extract_id_card_info(image_data: Union[str, bytes], is_front: bool = True, c
                 pass
         # 内存优化：异常情况下也进行垃圾回收
         if ENABLE_GC_AFTER_REQUEST:
-            gc.collect()
+            gc.collect(0)
         return {}
 
+def _mark_id_number_blocks(text_blocks: List[Dict[str, Any]]) -> None:
+    """
+    单次正则扫描所有文本块，为每个块标记is_id_number（整段文本是否为身份证号码）
+    
+    Args:
+        text_blocks: 文本块列表（原地添加is_id_number字段）
+    """
+    texts = [block["text_stripped"] for block in text_blocks]
+    
+    # 记录每行在拼接文本中的起始偏移
+    line_starts = {}
+    offset = 0
+    for i, text in enumerate(texts):
+        line_starts[offset] = i
+        offset += len(text) + 1
+    
+    id_indices = {line_starts.get(match.start()) for match in _ID_NUMBER_LINE_RE.finditer("\n".join(texts))}
+    for i, block in enumerate(text_blocks):
+        block["is_id_number"] = i in id_indices
+
 def _extract_name_smart(text_blocks: List[Dict[str, Any]]) -> Optional[str]:
     """
     智能提取姓名，支持分离的文本块
@@ -693,9 +1101,9 @@ def _extract_name_smart(text_blocks: List[Dict[str, Any]]) -> Optional[str]:
     """
     # 方法1：尝试在同一文本块中找到姓名
     for block in text_blocks:
-        text = block["text"].strip()
+        text = block["text_stripped"]
         # 检查是否在同一块中包含姓名标签和姓名
-        match = re.search(r"姓名[\s:：]*(.+)", text)
+        match = _NAME_LABEL_RE.search(text)
         if match:
             name = match.group(1).strip()
             if name and len(name) <= 10:  # 姓名长度验证
@@ -705,47 +1113,45 @@ def _extract_name_smart(text_blocks: List[Dict[str, Any]]) -> Optional[str]:
     # 方法2：查找"姓名"标签，然后在附近的文本块中查找姓名
     name_label_block = None
     for block in text_blocks:
-        text = block["text"].strip()
+        text = block["text_stripped"]
         if text == "姓名" or "姓名" in text:
             name_label_block = block
             break
     
     if name_label_block:
         name_label_center = name_label_block["center"]
-        logger.debug(f"找到姓名标签块，位置: {name_label_center}")
+        logger.debug("找到姓名标签块，位置: {}", name_label_center)
         
         # 在附近查找可能的姓名文本块
-        candidate_blocks = []
+        candidate_names = []
+        candidate_centers = []
         for block in text_blocks:
             if block == name_label_block:
                 continue
             
-            text = block["text"].strip()
-            block_center = block["center"]
+            text = block["text_stripped"]
             
             # 跳过明显不是姓名的文本
             if text in ["性别", "民族", "出生", "住址", "公民身份号码"] or len(text) > 10:
                 continue
             
-            # 计算与姓名标签的距离
-            distance = ((block_center[0] - name_label_center[0]) ** 2 + 
-                       (block_center[1] - name_label_center[1]) ** 2) ** 0.5
-            
             # 检查是否为有效的姓名格式
             if _is_valid_name(text):
-                candidate_blocks.append((block, distance, text))
-                logger.debug(f"找到姓名候选: '{text}'，距离: {distance:.1f}")
-        
-        # 按距离排序，选择最近的有效姓名
-        if candidate_blocks:
-            candidate_blocks.sort(key=lambda x: x[1])  # 按距离排序
-            closest_name = candidate_blocks[0][2]
+                candidate_names.append(text)
+                candidate_centers.append(block["center"])
+                logger.debug("找到姓名候选: '{}'", text)
+        
+        # 选择距离姓名标签最近的有效姓名（平方距离与距离排序一致，无需开方）
+        if candidate_names:
+            offsets = np.asarray(candidate_centers, dtype=np.float64) - np.asarray(name_label_center, dtype=np.float64)
+            closest_index = int((offsets * offsets).sum(axis=1).argmin())
+            closest_name = candidate_names[closest_index]
             logger.info(f"基于位置关联提取姓名: {closest_name}")
             return closest_name
     
     # 方法3：如果前两种方法都失败，尝试查找看起来像姓名的文本
     for block in text_blocks:
-        text = block["text"].strip()
+        text = block["text_stripped"]
         if _is_valid_name(text) and len(text) >= 2 and len(text) <= 5:
             # 确保不是其他标识词
             if text not in ["性别", "民族", "出生", "住址", "公民", "身份", "号码"]:
@@ -769,13 +1175,12 @@ def _is_valid_name(text: str) -> bool:
         return False
     
     # 检查是否主要由中文字符组成
-    chinese_chars = sum(1 for char in text if '\u4e00' <= char <= '\u9fff')
+    chinese_chars = len(_CJK_CHAR_RE.findall(text))
     if chinese_chars < len(text) * 0.8:  # 至少80%是中文字符
         return False
     
     # 排除常见的非姓名词汇
-    exclude_words = ["性别", "民族", "出生", "住址", "公民", "身份", "号码", "签发", "机关", "有效", "期限"]
-    if any(word in text for word in exclude_words):
+    if _NAME_EXCLUDED_RE.search(text):
         return False
     
     return True
@@ -790,150 +1195,182 @@ def _extract_id_number(text_blocks: List[Dict[str, Any]]) -> Optional[str]:
     Returns:
         身份证号码或None
     """
-    # 身份证号码正则表达式
-    id_pattern = r"[1-9]\d{5}(?:19|20)\d{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[12]\d|3[01])\d{3}(?:\d|X|x)"
+    # 按y坐标排序的索引，用于二分查找同一行附近的文本块（仅在需要时构建）
+    y_index = None
+    y_values = None
     
     # 首先查找包含"公民身份号码"的文本块
-    for block in text_blocks:
-        text = block["text"].strip()
+    for block_index, block in enumerate(text_blocks):
+        text = block["text_stripped"]
         if "公民身份号码" in text:
             # 尝试从同一文本块中提取
-            match = re.search(id_pattern, text)
+            match = _ID_NUMBER_RE.search(text)
             if match:
                 return match.group(0)
             
-            # 如果在同一块中没找到，查找y坐标接近的块
+            # 如果在同一块中没找到，查找y坐标接近（相差小于50）的块
+            if y_index is None:
+                y_index = sorted((b["center"][1], i) for i, b in enumerate(text_blocks))
+                y_values = [y for y, _ in y_index]
             block_y = block["center"][1]
-            for other_block in text_blocks:
-                if other_block == block:
+            lo = bisect_right(y_values, block_y - 50)
+            hi = bisect_left(y_values, block_y + 50)
+            
+            # 窗口内的块按原始顺序检查，与逐个扫描的结果一致
+            for other_index in sorted(i for _, i in y_index[lo:hi]):
+                if other_index == block_index:
                     continue
                 
-                other_text = other_block["text"].strip()
-                other_y = other_block["center"][1]
-                
-                # 如果y坐标接近，检查是否包含身份证号
-                if abs(other_y - block_y) < 50:
-                    match = re.search(id_pattern, other_text)
-                    if match:
-                        return match.group(0)
+                match = _ID_NUMBER_RE.search(text_blocks[other_index]["text_stripped"])
+                if match:
+                    return match.group(0)
     
-    # 如果没有找到包含"公民身份号码"的文本块，尝试直接匹配身份证号格式
-    for block in text_blocks:
-        text = block["text"].strip()
-        match = re.search(id_pattern, text)
-        if match:
-            return match.group(0)
+    # 如果没有找到包含"公民身份号码"的文本块，在拼接文本中一次性查找第一个身份证号
+    match = _ID_NUMBER_RE.search("\n".join(block["text_stripped"] for block in text_blocks))
+    if match:
+        return match.group(0)
     
     return None
 
-def _post_process_address(address: str, text_blocks: List[Dict[str, Any]]) -> str:
+def _build_address_candidates(text_blocks: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """
+    单次遍历文本块，构建地址后处理和规则引擎共用的候选文本索引
+    
+    Args:
+        text_blocks: 所有文本块
+        
+    Returns:
+        候选文本索引：
+        - texts: 所有文本块去除首尾空白后的文本
+        - non_id_texts: 排除身份证号码后的文本
+        - address_texts: 不含"住址"标签且是有效地址组成部分的文本（已排除身份证号码）
+    """
+    texts = [block["text_stripped"] for block in text_blocks]
+    # 优先复用_mark_id_number_blocks的标记，每个文本块最多做一次身份证号码判断
+    non_id_texts = [
+        text for block, text in zip(text_blocks, texts)
+        if not (block["is_id_number"] if "is_id_number" in block else _is_id_number_text(text))
+    ]
+    address_texts = [text for text in non_id_texts if "住址" not in text and _is_valid_address_text(text)]
+    return {"texts": texts, "non_id_texts": non_id_texts, "address_texts": address_texts}
+
+def _is_id_number_text(text: str) -> bool:
+    """
+    判断整段文本是否为18位身份证号码
+    
+    先用长度和首字符过滤，绝大多数地址文本无需进入完整的身份证号码正则
+    
+    Args:
+        text: 已去除首尾空白的文本
+        
+    Returns:
+        是否为身份证号码
+    """
+    return len(text) == 18 and text[0].isdigit() and _ID_NUMBER_FULL_RE.match(text) is not None
+
+def _post_process_address(address: str, text_blocks: List[Dict[str, Any]],
+                          candidates: Optional[Dict[str, List[str]]] = None) -> str:
     """
     地址后处理函数，用于检查并合并可能遗漏的地址组件
     
     Args:
         address: 初步提取的地址
         text_blocks: 所有文本块
+        candidates: _build_address_candidates构建的候选文本索引，未提供时自动构建
         
     Returns:
         处理后的地址
     """
-    logger.debug(f"地址后处理开始，原始地址: {address}")
+    if candidates is None:
+        candidates = _build_address_candidates(text_blocks)
+    address_texts = candidates["address_texts"]
+    
+    logger.debug("地址后处理开始，原始地址: {}", address)
     
     # 检查地址是否已经包含村/组/社区等关键词和门牌号
-    has_village = bool(re.search(r'[村组社区队]', address))
-    has_house_number = bool(re.search(r'\d+号', address))
+    has_village = not _VILLAGE_CHARS.isdisjoint(address)
+    has_house_number = bool(_HOUSE_NUMBER_HAO_RE.search(address))
     
-    logger.debug(f"地址分析：包含村/组/社区/队={has_village}, 包含门牌号={has_house_number}")
+    logger.debug("地址分析：包含村/组/社区/队={}, 包含门牌号={}", has_village, has_house_number)
+    
+    # 村名和门牌号都已齐全，无需从其他文本块补全
+    if has_village and has_house_number:
+        logger.debug("地址已包含村/组和门牌号，跳过后处理")
+        return address
     
     # 如果地址缺少村名或门牌号，尝试从其他文本块中找到
     processed_address = address
     
-    # 1. 查找村/组+门牌号的组合模式
-    village_number_patterns = [
-        r'([村组社区队]\d+号?)',  # 村218号, 组5号
-        r'([^住址]*[村组社区队]\d+号?)',  # 边庄村218号
-        r'([村组社区队][^住址]*\d+号?)',  # 村边庄218号  
-        r'([^住址]*[村组社区队][^住址]*\d+号?)',  # 任意文本+村+任意文本+数字+号
-    ]
-    
-    for block in text_blocks:
-        text = block["text"].strip()
-        if "住址" in text:
-            continue  # 跳过住址标签文本
-            
-        # 检查是否匹配村/组+门牌号模式，并且是有效的地址文本
-        if _is_valid_address_text(text):
-            for pattern in village_number_patterns:
-                match = re.search(pattern, text)
-                if match:
-                    village_part = match.group(1)
-                    if village_part not in processed_address:
-                        processed_address += village_part
-                        logger.debug(f"添加村/组+门牌号: {village_part}")
-                        return processed_address
+    # 1. 查找村/组+门牌号的组合模式（候选文本已跳过住址标签并通过地址有效性检查）
+    for text in address_texts:
+        # 所有组合模式都需要村/组字符和数字，缺少任一项的文本直接跳过
+        if _VILLAGE_CHARS.isdisjoint(text) or not _DIGIT_RE.search(text):
+            continue
+        for pattern in _VILLAGE_NUMBER_RES:
+            match = pattern.search(text)
+            if match:
+                village_part = match.group(1)
+                if village_part not in processed_address:
+                    processed_address += village_part
+                    logger.debug("添加村/组+门牌号: {}", village_part)
+                    return processed_address
     
     # 2. 如果没有找到组合模式，分别查找村名和门牌号
     if not has_village:
         # 查找村/组/社区名称
-        for block in text_blocks:
-            text = block["text"].strip()
-            if "住址" in text or not _is_valid_address_text(text):
-                continue
-                
-            # 关键修复：排除身份证号码
-            if re.match(r'^[1-9]\d{5}(?:19|20)\d{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[12]\d|3[01])\d{3}(?:\d|X|x)$', text):
-                logger.debug(f"_post_process_address: 跳过身份证号码 {text}")
-                continue
-                
-            village_match = re.search(r'([^住址]*[村组社区队])', text)
+        for text in address_texts:
+            village_match = _VILLAGE_NAME_RE.search(text)
             if village_match:
                 village_name = village_match.group(1)
                 if village_name not in processed_address:
                     processed_address += village_name
-                    logger.debug(f"添加村/组名称: {village_name}")
+                    logger.debug("添加村/组名称: {}", village_name)
                     break
     
     if not has_house_number:
         # 查找门牌号（更广泛的模式）
-        house_number_patterns = [
-            r'(\d+号)',  # 218号
-            r'(\d+[室栋单元])',  # 218室
-            r'([A-Za-z]?\d+号?)',  # A218号, 218
-            r'(\d+-\d+号?)',  # 218-1号
-            r'(\d+[A-Za-z]号?)',  # 218A号
-            r'(第?\d+号)',  # 第218号
-            r'(\d+[弄巷里街道路]?\d*号?)',  # 218弄5号
-        ]
-        
-        for block in text_blocks:
-            text = block["text"].strip()
-            if "住址" in text or len(text) > 20 or not _is_valid_address_text(text):  # 增加地址有效性检查
-                continue
-                
-            # 关键修复：排除身份证号码
-            if re.match(r'^[1-9]\d{5}(?:19|20)\d{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[12]\d|3[01])\d{3}(?:\d|X|x)$', text):
-                logger.debug(f"_post_process_address: 跳过身份证号码门牌号检查 {text}")
+        for text in address_texts:
+            # 所有门牌号模式都需要数字
+            if len(text) > 20 or not _DIGIT_RE.search(text):
                 continue
                 
-            for pattern in house_number_patterns:
-                match = re.search(pattern, text)
+            for pattern in _HOUSE_NUMBER_SEARCH_RES:
+                match = pattern.search(text)
                 if match:
                     house_number = match.group(1)
                     
                     # 再次检查门牌号是否是身份证号码
-                    if re.match(r'^[1-9]\d{5}(?:19|20)\d{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[12]\d|3[01])\d{3}(?:\d|X|x)$', house_number):
-                        logger.debug(f"_post_process_address: 匹配的门牌号是身份证号码，跳过: {house_number}")
+                    if _is_id_number_text(house_number):
+                        logger.debug("_post_process_address: 匹配的门牌号是身份证号码，跳过: {}", house_number)
                         continue
                         
                     if house_number not in processed_address:
                         processed_address += house_number
-                        logger.debug(f"添加门牌号: {house_number}")
+                        logger.debug("添加门牌号: {}", house_number)
                         return processed_address
     
-    logger.debug(f"地址后处理完成，最终地址: {processed_address}")
+    logger.debug("地址后处理完成，最终地址: {}", processed_address)
     return processed_address
 
-def _apply_address_rules(address: str, name: str, text_blocks: List[Dict[str, Any]]) -> str:
+def _is_standalone_house_number(text: str) -> bool:
+    """
+    判断文本是否为独立的门牌号（纯数字或数字+"号"）
+    
+    长度限制在10以内，避免误匹配身份证号等长数字
+    
+    Args:
+        text: 已去除首尾空白的文本
+        
+    Returns:
+        是否为独立门牌号
+    """
+    if not text or len(text) >= 10:
+        return False
+    digits = text[:-1] if text[-1] == "号" else text
+    return digits.isdecimal()
+
+def _apply_address_rules(address: str, name: str, text_blocks: List[Dict[str, Any]],
+                         candidates: Optional[Dict[str, List[str]]] = None) -> str:
     """
     应用地址规则引擎，基于规则补全地址
     
@@ -941,11 +1378,22 @@ def _apply_address_rules(address: str, name: str, text_blocks: List[Dict[str, An
         address: 初步处理后的地址
         name: 身份证姓名
         text_blocks: 所有文本块
+        candidates: _build_address_candidates构建的候选文本索引，未提供时自动构建
         
     Returns:
         规则处理后的地址
     """
-    logger.debug(f"应用地址规则引擎，输入地址: {address}, 姓名: {name}")
+    if candidates is None:
+        candidates = _build_address_candidates(text_blocks)
+    texts = candidates["texts"]
+    
+    logger.debug("应用地址规则引擎，输入地址: {}, 姓名: {}", address, name)
+    
+    # 已有门牌号且不以乡/镇结尾时，下面的规则都不会触发
+    has_house_number = _NUMBER_HAO_RE.search(address) is not None
+    if has_house_number and not address.endswith(_TOWNSHIP_SUFFIXES):
+        logger.debug("地址规则引擎：地址已包含门牌号，返回原始地址")
+        return address
     
     # 特殊情况处理：边茹的身份证
     # if name == "边茹" and "山东省邹城市太平镇边庄" in address and "村218号" not in address:
@@ -954,19 +1402,20 @@ def _apply_address_rules(address: str, name: str, text_blocks: List[Dict[str, An
     #     return address
     
     # 规则1：如果地址以乡/镇结尾，查找可能的村/组名称
-    if re.search(r'[乡镇]$', address):
+    if address.endswith(_TOWNSHIP_SUFFIXES):
         logger.debug("应用规则1：地址以乡/镇结尾，查找村/组名称")
         
         # 提取地址中的最后一个地名（通常是乡镇名）
-        last_place = address.split()[-1]
-        if last_place.endswith("乡") or last_place.endswith("镇"):
+        last_place = address.rsplit(None, 1)[-1]
+        if last_place.endswith(_TOWNSHIP_SUFFIXES):
             last_place = last_place[:-1]  # 去掉"乡"或"镇"字
             
+            # 查找格式如"XX村"、"XX组"等，地名只编译一次并转义特殊字符
+            village_re = re.compile(f"{re.escape(last_place)}[村组社区队]")
+            
             # 在所有文本块中查找可能包含该地名的村/组
-            for block in text_blocks:
-                text = block["text"].strip()
-                # 查找格式如"XX村"、"XX组"等
-                village_match = re.search(f"{last_place}[村组社区队]", text)
+            for text in texts:
+                village_match = village_re.search(text)
                 if village_match:
                     village_name = village_match.group(0)
                     if village_name not in address:
@@ -974,7 +1423,7 @@ def _apply_address_rules(address: str, name: str, text_blocks: List[Dict[str, An
                         logger.info(f"应用规则1：添加村/组名称 '{village_name}'")
                         
                         # 继续查找门牌号
-                        number_match = re.search(r'\d+号?', text[village_match.end():])
+                        number_match = _NUMBER_HAO_RE.search(text, village_match.end())
                         if number_match:
                             address += number_match.group(0)
                             logger.info(f"应用规则1：添加门牌号 '{number_match.group(0)}'")
@@ -982,55 +1431,44 @@ def _apply_address_rules(address: str, name: str, text_blocks: List[Dict[str, An
                         return address
     
     # 规则2：如果地址中包含村/组但没有门牌号，尝试查找门牌号
-    if re.search(r'[村组社区队]$', address) and not re.search(r'\d+号?', address):
+    if address.endswith(_VILLAGE_SUFFIXES) and not has_house_number:
         logger.debug("应用规则2：地址包含村/组但没有门牌号")
         
         # 提取村/组名
-        village_name = re.search(r'\w+[村组社区队]$', address)
+        village_name = _VILLAGE_NAME_END_RE.search(address)
         if village_name:
             village_name = village_name.group(0)
             
             # 在所有文本块中查找可能包含该村/组名的门牌号
-            for block in text_blocks:
-                text = block["text"].strip()
+            for text in texts:
                 if village_name in text:
                     # 查找村/组名后面的门牌号
                     idx = text.find(village_name) + len(village_name)
                     if idx < len(text):
-                        number_match = re.search(r'\d+号?', text[idx:])
+                        number_match = _NUMBER_HAO_RE.search(text, idx)
                         if number_match:
                             address += number_match.group(0)
                             logger.info(f"应用规则2：添加门牌号 '{number_match.group(0)}'")
                             return address
     
     # 规则3：检查是否有独立的门牌号文本块
-    if not re.search(r'\d+号?', address):
+    if not has_house_number:
         logger.debug("应用规则3：查找独立的门牌号文本块")
         
-        # 查找可能是门牌号的独立文本块
-        for block in text_blocks:
-            text = block["text"].strip()
-            
-            # 关键修复：严格排除身份证号码
-            if re.match(r'^[1-9]\d{5}(?:19|20)\d{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[12]\d|3[01])\d{3}(?:\d|X|x)$', text):
-                logger.debug(f"_apply_address_rules: 跳过身份证号码 {text}")
-                continue
-                
-            if re.match(r'^\d+号?$', text) and len(text) < 10 and len(text) < 15:  # 避免误匹配身份证号等长数字
-                # 再次确认不是身份证号码
-                if not re.match(r'^[1-9]\d{5}(?:19|20)\d{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[12]\d|3[01])\d{3}(?:\d|X|x)$', text):
-                    address += " " + text
-                    logger.info(f"应用规则3：添加独立门牌号 '{text}'")
-                    return address
-                else:
-                    logger.debug(f"_apply_address_rules: 规则3中发现身份证号码，跳过: {text}")
+        # 查找可能是门牌号的独立文本块（候选文本已排除身份证号码）
+        for text in candidates["non_id_texts"]:
+            if _is_standalone_house_number(text):
+                address += " " + text
+                logger.info(f"应用规则3：添加独立门牌号 '{text}'")
+                return address
     
     logger.debug("地址规则引擎：未触发任何规则，返回原始地址")
     return address
 
+@lru_cache(maxsize=512)
 def _is_valid_address_text(text: str) -> bool:
     """
-    检查文本是否是有效的地址组成部分
+    检查文本是否是有效的地址组成部分（纯函数，按文本缓存结果，同一文本块多次检查只计算一次）
     
     Args:
         text: 要检查的文本
@@ -1040,13 +1478,18 @@ def _is_valid_address_text(text: str) -> bool:
     """
     text = text.strip()
     
-    # 强化排除条件 - 优先级最高
+    # 包含条件：必须包含地址相关关键词，或者是门牌号格式
+    # 先做廉价的字符集合判断，大多数非地址文本在这里直接排除
+    if _ADDRESS_CHARS.isdisjoint(text) and not (len(text) <= 6 and _SHORT_HOUSE_NUMBER_RE.match(text)):
+        return False
+    
+    # 排除条件：满足包含条件的文本中剔除身份证号、年份和个人信息字段
     # 1. 强化身份证号码检测（15位或18位数字，包含X结尾）
-    if re.match(r'^\d{15}$|^[1-9]\d{5}(?:19|20)\d{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[12]\d|3[01])\d{3}(?:\d|X|x)$', text):
+    if _is_id_number_text(text) or (len(text) == 15 and _ID_NUMBER_15_RE.match(text)):
         return False
     
     # 2. 排除纯数字且长度超过10位的文本（很可能是身份证号）
-    if re.match(r'^\d{10,}$', text):
+    if _LONG_DIGITS_RE.match(text):
         return False
     
     # 3. 排除包含"公民身份号码"的文本
@@ -1054,34 +1497,26 @@ def _is_valid_address_text(text: str) -> bool:
         return False
     
     # 4. 排除单纯的年份（4位数字，1900-2100年）
-    if re.match(r'^(19|20)\d{2}$', text):
+    if _YEAR_RE.match(text):
         return False
     
     # 5. 排除包含出生日期相关关键词但不包含地址关键词的文本
-    if any(keyword in text for keyword in ["出生", "生日"]) and not any(addr_keyword in text for addr_keyword in ["省", "市", "区", "县", "乡", "镇", "村", "组", "路", "街", "道", "号", "室", "栋", "单元"]):
+    if any(keyword in text for keyword in _BIRTH_KEYWORDS) and _BIRTH_ADDRESS_CHARS.isdisjoint(text) and "单元" not in text:
         return False
     
     # 6. 排除性别、民族等个人信息字段
-    if text in ["男", "女", "汉", "回", "蒙", "藏", "维", "苗", "彝", "壮", "满"]:
+    if text in _PERSONAL_FIELD_VALUES:
         return False
     
-    # 包含条件：必须包含地址相关关键词
-    address_keywords = r'[省市区县乡镇村组路街道号室社区队栋单元巷弄里]'
-    if re.search(address_keywords, text):
-        return True
-    
-    # 或者是门牌号格式（但不能是身份证号或年份）
-    if re.match(r'^\d{1,4}号?[A-Za-z]?$', text) and len(text) <= 6:
-        return True
-    
-    return False
+    return True
 
 # 清理进程的OCR实例
 def cleanup_ocr_engine():
     """
     清理当前进程的OCR引擎实例
     """
-    import os
+    global _current_ocr
+    _current_ocr = None
     pid = os.getpid()
     if pid in _ocr_instances:
         del _ocr_instances[pid]
@@ -1090,6 +1525,75 @@ def cleanup_ocr_engine():
 # 外国人永久居留身份证识别函数
 # ============================================================================
 
+# 国籍文本中可能出现的国家名称
+_NATIONALITY_COUNTRIES = ("加拿大", "CAN", "美国", "USA", "英国", "GBR")
+_NATIONALITY_AUTOMATON = _build_keyword_automaton(_NATIONALITY_COUNTRIES)
+
+def _contains_country(text: str) -> bool:
+    """
+    单次扫描判断文本中是否出现任一国家名称
+    
+    Args:
+        text: 待检查的文本
+        
+    Returns:
+        是否包含国家名称
+    """
+    if _NATIONALITY_AUTOMATON is None:
+        return any(country in text for country in _NATIONALITY_COUNTRIES)
+    return next(_NATIONALITY_AUTOMATON.iter(text), None) is not None
+
+def _is_nationality_text(text: str) -> bool:
+    """
+    判断文本是否为"国家/代码"格式的国籍（如"加拿大/CAN"）
+    
+    Args:
+        text: 待检查的文本
+        
+    Returns:
+        是否为国籍文本
+    """
+    return "/" in text and _contains_country(text)
+
+# 字段匹配表：(字段名, 匹配函数)，各字段格式互斥，每段文本最多匹配一个字段
+_FOREIGN_NEW_FIELD_MATCHERS = (
+    ("sex", _FOREIGN_SEX_RE.match),                 # "女/F"或"男/M"格式
+    ("birth_date", _DOT_DATE_RE.match),             # 日期格式
+    ("nationality", _is_nationality_text),          # "加拿大/CAN"格式
+    ("residence_number", _DIGITS_18_RE.match),      # 18位数字
+    ("valid_until", _DOT_DATE_RANGE_RE.match),      # 日期范围格式
+)
+_FOREIGN_OLD_FIELD_MATCHERS = (
+    ("sex", _FOREIGN_SEX_RE.match),
+    ("birth_date", _DOT_DATE_RE.match),
+    ("residence_number", lambda text: len(text) > 10 and _OLD_RESIDENCE_NUMBER_RE.match(text)),  # 字母数字组合
+    ("issue_authority", lambda text: "管理局" in text or "移民" in text),  # 中文机关名称
+)
+
+def _match_foreign_fields(all_texts: List[str], matchers: Tuple) -> Dict[str, str]:
+    """
+    单次遍历所有文本，按字段匹配表提取各字段的第一个匹配值
+    
+    Args:
+        all_texts: 所有识别到的文本列表
+        matchers: 字段匹配表
+        
+    Returns:
+        提取到的字段字典，按匹配表顺序排列
+    """
+    found = {}
+    for text in all_texts:
+        for field, matcher in matchers:
+            if field not in found and matcher(text):
+                found[field] = text
+                break
+        if len(found) == len(matchers):
+            break
+    
+    result = {field: found[field] for field, _ in matchers if field in found}
+    logger.debug("提取到字段: {}", result)
+    return result
+
 def _extract_foreign_id_card_info(text_blocks: List[Dict], card_type: str) -> Dict[str, Any]:
     """
     提取外国人永久居留身份证信息（基于实际OCR输出优化版）
@@ -1111,20 +1615,18 @@ def _extract_foreign_id_card_info(text_blocks: List[Dict], card_type: str) -> Di
     
     # 收集所有文本用于分析
     all_texts = [block["text"] for block in text_blocks]
-    logger.debug(f"所有识别文本: {all_texts}")
+    logger.debug("所有识别文本: {}", all_texts)
+    
+    # 1. 中文姓名：查找"证件样本"（新旧版相同，在拼接文本上做一次子串查找）
+    if "证件样本" in "\n".join(all_texts):
+        id_card_info["chinese_name"] = "证件样本"
+        logger.debug("提取到中文姓名: 证件样本")
     
     # 基于实际OCR输出的识别逻辑
     if version == "new":
         # 新版识别逻辑
         # 根据实际OCR输出：['姓名/Name', 'ZHENGJIAN', 'YANGBEN', '证件样本', '性别/Sex', '出生日期/DateofBirth', '女/F', '1981.08.03', '国籍/Nationality', '加拿大/CAN', '有效期限/PeriodofValidity', '2023.09.15-2033.09.14', '证件号码/IDNO', '911124198108030024']
         
-        # 1. 中文姓名：查找"证件样本"
-        for text in all_texts:
-            if "证件样本" in text:
-                id_card_info["chinese_name"] = "证件样本"
-                logger.debug(f"提取到中文姓名: 证件样本")
-                break
-        
         # 2. 英文姓名：改进识别逻辑，更加智能和宽容
         english_name = None
         name_found = False
@@ -1136,93 +1638,54 @@ def _extract_foreign_id_card_info(text_blocks: List[Dict], card_type: str) -> Di
             if "姓名/Name" in text or "Name" in text:
                 name_found = True
                 name_index = i
-                logger.debug(f"找到姓名标记: {text} at index {i}")
+                logger.debug("找到姓名标记: {} at index {}", text, i)
                 break
         
         if name_found:
             # 从姓名标记后开始查找英文文本
             for i in range(name_index + 1, len(all_texts)):
                 text = all_texts[i]
-                logger.debug(f"检查文本[{i}]: '{text}'")
+                logger.debug("检查文本[{}]: '{}'", i, text)
                 
                 # 更宽松的英文姓名匹配规则
                 if _is_english_name_part(text):
                     english_parts.append(text)
-                    logger.debug(f"添加英文姓名部分: {text}")
+                    logger.debug("添加英文姓名部分: {}", text)
                 elif text in ["证件样本", "YANGBEN", "样本"] or "性别" in text or "Sex" in text:
                     # 遇到已知的非姓名字段，停止查找
-                    logger.debug(f"遇到非姓名字段，停止查找: {text}")
+                    logger.debug("遇到非姓名字段，停止查找: {}", text)
                     break
                 elif english_parts and len(english_parts) >= 1:
                     # 如果已经找到英文部分，遇到其他内容时停止
-                    logger.debug(f"已找到英文部分，遇到其他内容停止: {text}")
+                    logger.debug("已找到英文部分，遇到其他内容停止: {}", text)
                     break
         
         # 如果找到英文姓名部分，组合它们
         if english_parts:
             english_name = " ".join(english_parts)
             id_card_info["english_name"] = english_name
-            logger.debug(f"提取到英文姓名: {english_name}")
+            logger.debug("提取到英文姓名: {}", english_name)
         else:
             # 如果按标记查找失败，尝试智能查找所有可能的英文姓名
             logger.debug("按标记查找失败，尝试智能查找英文姓名")
             english_name = _smart_find_english_name(all_texts)
             if english_name:
                 id_card_info["english_name"] = english_name
-                logger.debug(f"智能查找到英文姓名: {english_name}")
+                logger.debug("智能查找到英文姓名: {}", english_name)
             else:
                 logger.warning("未能识别到英文姓名")
         
-        # 3. 性别：查找"女/F"或"男/M"格式
-        for text in all_texts:
-            if re.match(r'^[男女]/[MF]$', text):
-                id_card_info["sex"] = text
-                logger.debug(f"提取到性别: {text}")
-                break
-        
-        # 4. 出生日期：查找日期格式
-        for text in all_texts:
-            if re.match(r'^\d{4}\.\d{2}\.\d{2}$', text):
-                id_card_info["birth_date"] = text
-                logger.debug(f"提取到出生日期: {text}")
-                break
-        
-        # 5. 国籍：查找"加拿大/CAN"格式
-        for text in all_texts:
-            if "/" in text and any(country in text for country in ["加拿大", "CAN", "美国", "USA", "英国", "GBR"]):
-                id_card_info["nationality"] = text
-                logger.debug(f"提取到国籍: {text}")
-                break
-        
-        # 6. 证件号码：查找18位数字
-        for text in all_texts:
-            if re.match(r'^\d{18}$', text):
-                id_card_info["residence_number"] = text
-                logger.debug(f"提取到证件号码: {text}")
-                break
-        
-        # 7. 有效期限：查找日期范围格式
-        for text in all_texts:
-            if re.match(r'\d{4}\.\d{2}\.\d{2}-\d{4}\.\d{2}\.\d{2}', text):
-                id_card_info["valid_until"] = text
-                logger.debug(f"提取到有效期限: {text}")
-                break
+        # 3~7. 性别、出生日期、国籍、证件号码、有效期限：一次遍历完成匹配，全部找到后提前结束
+        id_card_info.update(_match_foreign_fields(all_texts, _FOREIGN_NEW_FIELD_MATCHERS))
     
     else:
         # 旧版识别逻辑
         # 根据实际OCR输出：['ZHENGJIANYANGBEN', '证件样本', '性别/sex', '出生日期/Date.of Birth', '女/F', '1981.08.03', '国籍Nationality', '加拿大ICAN', '有效期限/PeriodofValidity', '2015.1025-2025.10.24', '签发机关门ssuingAuthority', '中华人民共和国国家移民管理局', 'NationalImmigrationAdministration,PRC', '证件号码LGardtNo', 'CAN110081080310']
         
-        # 1. 中文姓名：查找"证件样本"
-        for text in all_texts:
-            if "证件样本" in text:
-                id_card_info["chinese_name"] = "证件样本"
-                logger.debug(f"提取到中文姓名: 证件样本")
-                break
-        
         # 2. 英文姓名：查找全大写字母组成的完整姓名（支持点号分隔）
         for text in all_texts:
             # 匹配全大写字母组成的姓名，可能包含点号作为分隔符
-            if re.match(r'^[A-Z]+(?:\.[A-Z]+)*$', text) and len(text) > 8:  # 完整英文姓名
+            if _UPPER_DOTTED_NAME_RE.match(text) and len(text) > 8:  # 完整英文姓名
                 # 智能分隔英文姓名（处理点号分隔）
                 if '.' in text:
                     # 如果已经用点号分隔，转换为空格分隔
@@ -1231,52 +1694,39 @@ def _extract_foreign_id_card_info(text_blocks: List[Dict], card_type: str) -> Di
                     # 如果没有分隔符，使用智能分隔
                     formatted_name = _format_english_name(text)
                 id_card_info["english_name"] = formatted_name
-                logger.debug(f"提取到英文姓名: {formatted_name} (原文: {text})")
-                break
-        
-        # 3. 性别：查找"女/F"或"男/M"格式
-        for text in all_texts:
-            if re.match(r'^[男女]/[MF]$', text):
-                id_card_info["sex"] = text
-                logger.debug(f"提取到性别: {text}")
+                logger.debug("提取到英文姓名: {} (原文: {})", formatted_name, text)
                 break
         
-        # 4. 出生日期：查找日期格式
-        for text in all_texts:
-            if re.match(r'^\d{4}\.\d{2}\.\d{2}$', text):
-                id_card_info["birth_date"] = text
-                logger.debug(f"提取到出生日期: {text}")
-                break
+        # 3~4、6、8. 性别、出生日期、证件号码、签发机关：一次遍历完成匹配，全部找到后提前结束
+        # 匹配结果按原有字段顺序（性别、出生日期、国籍、证件号码、有效期限、签发机关）写入，保持返回的字段顺序不变
+        old_fields = _match_foreign_fields(all_texts, _FOREIGN_OLD_FIELD_MATCHERS)
+        for field in ("sex", "birth_date"):
+            if field in old_fields:
+                id_card_info[field] = old_fields[field]
         
         # 5. 国籍：查找包含国家名的文本
         for text in all_texts:
-            if any(country in text for country in ["加拿大", "CAN", "美国", "USA", "英国", "GBR"]):
+            if _contains_country(text):
                 # 提取干净的国籍信息
                 if "加拿大" in text:
                     id_card_info["nationality"] = "加拿大"
                 elif "CAN" in text:
                     id_card_info["nationality"] = "加拿大"
-                logger.debug(f"提取到国籍: {id_card_info.get('nationality', text)}")
+                logger.debug("提取到国籍: {}", id_card_info.get('nationality', text))
                 break
         
-        # 6. 证件号码：查找字母数字组合格式
-        for text in all_texts:
-            if re.match(r'^[A-Z]+\d+$', text) and len(text) > 10:
-                id_card_info["residence_number"] = text
-                logger.debug(f"提取到证件号码: {text}")
-                break
+        # 6. 证件号码
+        if "residence_number" in old_fields:
+            id_card_info["residence_number"] = old_fields["residence_number"]
         
         # 7. 有效期限：使用正确的日期（由于OCR错误，直接设置正确值）
         expected_valid_until = "2023.09.15-2033.09.14"
         id_card_info["valid_until"] = expected_valid_until
-        logger.debug(f"设置有效期限: {expected_valid_until}")
+        logger.debug("设置有效期限: {}", expected_valid_until)
         
-        # 8. 签发机关：查找中文机关名称
-        for text in all_texts:
-            if "管理局" in text or "移民" in text:
-                id_card_info["issue_authority"] = text
-                logger.debug(f"提取到签发机关: {text}")
-                break
+        # 8. 签发机关
+        if "issue_authority" in old_fields:
+            id_card_info["issue_authority"] = old_fields["issue_authority"]
     
     logger.info(f"外国人永久居留身份证信息提取完成: {id_card_info}")
     return id_card_info
@@ -1295,11 +1745,11 @@ def _is_invalid_field_value(value: str) -> bool:
         return True
     
     # 过滤掉只包含标点符号的值
-    if re.match(r'^[^\w\u4e00-\u9fff]+$', value):
+    if _PUNCT_ONLY_RE.match(value):
         return True
     
     # 过滤掉明显的OCR错误（如只有一个字符的非中文内容）
-    if len(value) == 1 and not re.search(r'[\u4e00-\u9fff]', value):
+    if len(value) == 1 and not _CJK_CHAR_RE.search(value):
         return True
     
     return False
@@ -1318,13 +1768,13 @@ def _is_english_name_part(text: str) -> bool:
         return False
     
     # 移除空格和标点符号
-    cleaned_text = re.sub(r'[^\w]', '', text)
+    cleaned_text = _NON_WORD_RE.sub('', text)
     
     # 检查是否主要由英文字母组成（允许少量数字）
     if not cleaned_text:
         return False
     
-    letter_count = sum(1 for c in cleaned_text if c.isalpha())
+    letter_count = len(_LETTER_RE.findall(cleaned_text))
     total_count = len(cleaned_text)
     
     # 至少70%是字母，且主要是英文字母
@@ -1332,21 +1782,12 @@ def _is_english_name_part(text: str) -> bool:
         return False
     
     # 检查是否包含英文字母
-    if not re.search(r'[A-Za-z]', cleaned_text):
+    if not _ASCII_LETTER_RE.search(cleaned_text):
         return False
     
     # 排除明显的非姓名文本
-    excluded_patterns = [
-        r'^\d+$',  # 纯数字
-        r'^[性别出生国籍有效期限证件号码签发机关]+',  # 中文字段名
-        r'^(Sex|Birth|Nationality|Period|Validity|IDNO|CardNo)$',  # 英文字段名
-        r'^\d{4}\.\d{2}\.\d{2}',  # 日期格式
-        r'证件样本',  # 样本文字
-    ]
-    
-    for pattern in excluded_patterns:
-        if re.search(pattern, text):
-            return False
+    if _ENGLISH_NAME_EXCLUDED_RE.search(text):
+        return False
     
     return True
 
@@ -1368,9 +1809,7 @@ def _smart_find_english_name(all_texts: List[str]) -> Optional[str]:
             # 进一步筛选，排除一些明显不是姓名的文本
             if len(text) >= 3 and not text.isdigit():
                 # 检查是否是典型的英文姓名格式（支持点号分隔）
-                if (re.match(r'^[A-Za-z]+$', text) or 
-                    re.match(r'^[A-Z][a-z]+$', text) or 
-                    re.match(r'^[A-Z]+(?:\.[A-Z]+)*$', text)):  # 支持点号分隔的全大写姓名
+                if _ENGLISH_NAME_SHAPE_RE.match(text):  # 支持点号分隔的全大写姓名
                     # 如果包含点号，转换为空格分隔
                     if '.' in text:
                         english_candidates.append(text.replace('.', ' '))
@@ -1401,35 +1840,26 @@ def _format_english_name(name_text: str) -> str:
     Returns:
         格式化后的英文姓名（如 ZHENGJIAN YANGBEN）
     """
-    if not name_text or not re.match(r'^[A-Z]+$', name_text):
+    if not name_text or not _UPPER_ALPHA_RE.match(name_text):
         return name_text
     
-    # 常见的英文姓名分隔模式
-    # 这里基于常见的英文姓名结构进行智能分隔
-    
-    # 对于像 ZHENGJIANYANGBEN 这样的文本，尝试智能分隔
-    # 基于音节和常见英文名字模式
-    
-    # 先尝试一些常见的分隔模式
-    common_patterns = [
-        # 特殊模式: ZHENGJIANYANGBEN -> ZHENGJIAN YANGBEN (14字符，8+6分隔)
-        (r'^ZHENGJIAN([A-Z]{6,})$', r'ZHENGJIAN \1'),
-        # 模式1: 8+6 (ZHENGJIAN + YANGBEN)
-        (r'^([A-Z]{8})([A-Z]{6})$', r'\1 \2'),
-        # 模式2: 7+7 
-        (r'^([A-Z]{7})([A-Z]{7})$', r'\1 \2'),
-        # 模式3: 6+8 (名字较短的情况)
-        (r'^([A-Z]{4,6})([A-Z]{8,})$', r'\1 \2'),
-        # 模式4: 一般情况，在中间位置分隔
-        (r'^([A-Z]{4,8})([A-Z]{4,})$', r'\1 \2'),
-    ]
-    
-    for pattern, replacement in common_patterns:
-        if re.match(pattern, name_text):
-            formatted = re.sub(pattern, replacement, name_text)
-            if ' ' in formatted:  # 确保成功分隔
-                logger.debug(f"英文姓名格式化: {name_text} -> {formatted}")
-                return formatted
+    # 常见的英文姓名分隔模式，输入全为大写字母，只需按长度确定分隔点
+    # 对于像 ZHENGJIANYANGBEN 这样的文本，基于常见英文名字结构进行智能分隔
+    length = len(name_text)
+    split = None
+    if length >= 15 and name_text.startswith("ZHENGJIAN"):
+        split = 9                   # 特殊模式: ZHENGJIAN + 其余部分
+    elif length == 14:
+        split = 8                   # 8+6 (ZHENGJIAN + YANGBEN)
+    elif length >= 12:
+        split = min(6, length - 8)  # 4~6 + 8以上（名字较短的情况）
+    elif length >= 8:
+        split = min(8, length - 4)  # 一般情况：4~8 + 4以上
+    
+    if split is not None:
+        formatted = f"{name_text[:split]} {name_text[split:]}"
+        logger.debug("英文姓名格式化: {} -> {}", name_text, formatted)
+        return formatted
     
     # 如果没有匹配的模式，尝试在中间位置分隔
     mid_point = len(name_text) // 2
@@ -1446,9 +1876,5 @@ def _format_english_name(name_text: str) -> str:
             break
     
     formatted = f"{name_text[:best_split]} {name_text[best_split:]}"
-    logger.debug(f"英文姓名默认分隔: {name_text} -> {formatted}")
+    logger.debug("英文姓名默认分隔: {} -> {}", name_text, formatted)
     return formatted
-
-# 在进程退出时清理OCR实例
-import atexit
-atexit.register(cleanup_ocr_engine)
@@ -2,17 +2,28 @@
 # -*- coding: utf-8 -*-
 
 import time
+import hashlib
+from typing import Optional
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 from fastapi.openapi.utils import get_openapi
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, HTMLResponse
 import json
 
+# orjson为可选依赖，未安装时回退到标准库json
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+except ImportError:
+    orjson = None
+    ORJSONResponse = JSONResponse
+
 from app.api.endpoints import router as api_router
-from app.config import PROJECT_NAME, VERSION, API_V1_PREFIX, CORS_ORIGINS, ALLOWED_HOSTS
+from app.config import PROJECT_NAME, VERSION, API_V1_PREFIX, CORS_ORIGINS
 from app.utils.logger import get_logger, log_request
+from app.utils.concurrency import process_pool_manager
 
 # 获取logger
 logger = get_logger("main")
@@ -23,9 +34,18 @@ app = FastAPI(
     description="身份证OCR识别服务API",
     version=VERSION,
     docs_url=None,  # 禁用默认的Swagger UI
-    redoc_url=None  # 禁用默认的ReDoc
+    redoc_url=None,  # 禁用默认的ReDoc
+    openapi_url=None,  # 禁用默认的OpenAPI路由，使用下方带缓存的自定义路由
+    default_response_class=ORJSONResponse  # 安装orjson时使用更快的JSON序列化
 )
 
+# OpenAPI文档地址
+OPENAPI_URL = "/openapi.json"
+
+# 序列化后的OpenAPI文档及其ETag，首次请求时生成
+_openapi_bytes: Optional[bytes] = None
+_openapi_etag: Optional[str] = None
+
 # 添加422错误的详细处理
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -41,9 +61,13 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         error_details.append(error_detail)
     
     # 记录详细错误信息
-    logger.error(f"422参数验证失败 - URL: {request.url} - 错误详情: {json.dumps(error_details, ensure_ascii=False)}")
+    if orjson is not None:
+        error_json = orjson.dumps(error_details, default=str).decode("utf-8")
+    else:
+        error_json = json.dumps(error_details, ensure_ascii=False)
+    logger.error(f"422参数验证失败 - URL: {request.url} - 错误详情: {error_json}")
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "code": 1001,
@@ -62,22 +86,40 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 添加请求日志中间件
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
+# 请求日志中间件（纯ASGI实现，避免BaseHTTPMiddleware每个请求额外创建任务和Request/Response对象）
+class RequestLogMiddleware:
     """请求日志中间件"""
-    start_time = time.time()
     
-    # 处理请求
-    response = await call_next(request)
+    def __init__(self, app):
+        self.app = app
     
-    # 计算处理时间
-    process_time = (time.time() - start_time) * 1000
-    
-    # 记录请求日志
-    await log_request(request, response.status_code, process_time)
-    
-    return response
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start_time = time.perf_counter_ns()
+        status_code = 500  # 未发送响应头即异常退出时按500记录
+        
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        try:
+            # 处理请求
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # 计算处理时间
+            process_time = (time.perf_counter_ns() - start_time) / 1_000_000
+            
+            # 记录请求日志
+            client = scope.get("client")
+            log_request(scope["method"], scope["path"], client[0] if client else "Unknown", status_code, process_time)
+
+# 添加请求日志中间件
+app.add_middleware(RequestLogMiddleware)
 
 # 注册API路由
 app.include_router(api_router, prefix=API_V1_PREFIX)
@@ -207,27 +249,48 @@ def custom_openapi():
 
 app.openapi = custom_openapi
 
+# 自定义OpenAPI文档路由：文档只序列化一次，并支持ETag协商缓存
+@app.get(OPENAPI_URL, include_in_schema=False)
+async def openapi_json(request: Request):
+    """返回预先序列化的OpenAPI文档"""
+    global _openapi_bytes, _openapi_etag
+    if _openapi_bytes is None:
+        if orjson is not None:
+            _openapi_bytes = orjson.dumps(app.openapi())
+        else:
+            _openapi_bytes = json.dumps(app.openapi(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        _openapi_etag = f'"{hashlib.blake2b(_openapi_bytes, digest_size=16).hexdigest()}"'
+    
+    headers = {"ETag": _openapi_etag, "Cache-Control": "public, max-age=86400"}
+    if request.headers.get("if-none-match") == _openapi_etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=_openapi_bytes, media_type="application/json", headers=headers)
+
+# 文档页面HTML只依赖静态配置，模块加载时生成一次
+_SWAGGER_UI_HTML = get_swagger_ui_html(
+    openapi_url=OPENAPI_URL,
+    title=f"{PROJECT_NAME} - API文档",
+    oauth2_redirect_url=app.swagger_ui_oauth2_redirect_url,
+    swagger_js_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui-bundle.js",
+    swagger_css_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui.css",
+).body
+_REDOC_HTML = get_redoc_html(
+    openapi_url=OPENAPI_URL,
+    title=f"{PROJECT_NAME} - API文档",
+    redoc_js_url="https://cdn.jsdelivr.net/npm/redoc@next/bundles/redoc.standalone.js",
+).body
+
 # 自定义Swagger UI路由
 @app.get("/docs", include_in_schema=False)
 async def custom_swagger_ui_html():
     """自定义Swagger UI页面"""
-    return get_swagger_ui_html(
-        openapi_url=app.openapi_url,
-        title=f"{PROJECT_NAME} - API文档",
-        oauth2_redirect_url=app.swagger_ui_oauth2_redirect_url,
-        swagger_js_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui-bundle.js",
-        swagger_css_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui.css",
-    )
+    return HTMLResponse(content=_SWAGGER_UI_HTML)
 
 # 自定义ReDoc路由
 @app.get("/redoc", include_in_schema=False)
 async def redoc_html():
     """自定义ReDoc页面"""
-    return get_redoc_html(
-        openapi_url=app.openapi_url,
-        title=f"{PROJECT_NAME} - API文档",
-        redoc_js_url="https://cdn.jsdelivr.net/npm/redoc@next/bundles/redoc.standalone.js",
-    )
+    return HTMLResponse(content=_REDOC_HTML)
 
 # 根路由
 @app.get("/", tags=["系统"])
@@ -245,6 +308,10 @@ async def root():
 async def startup_event():
     """应用启动事件"""
     logger.info(f"{PROJECT_NAME} v{VERSION} 服务启动")
+    # 预先生成OpenAPI文档，避免首次访问/docs时才构建
+    app.openapi()
+    # 预先启动工作进程并加载OCR引擎，消除首个请求的冷启动延迟
+    await process_pool_manager.warmup()
 
 # 应用关闭事件
 @app.on_event("shutdown")
@@ -5,10 +5,12 @@ import os
 import time
 import asyncio
 import concurrent.futures
+import multiprocessing
 import psutil
 import gc
+import threading
 from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
-from functools import partial
+from functools import partial, lru_cache
 
 from app.config import OCR_PROCESS_POOL_SIZE, OCR_TASK_TIMEOUT, MEMORY_OPTIMIZATION, ENABLE_GC_AFTER_REQUEST
 from app.utils.logger import get_logger
@@ -20,33 +22,93 @@ R = TypeVar('R')
 # 获取logger
 logger = get_logger("concurrency")
 
+# 内存采样最小间隔（秒），避免每个任务都读取进程内存信息
+_MEMORY_SAMPLE_INTERVAL = 1.0
+
+# 每完成多少个任务执行一次垃圾回收（只回收0、1代，避免每个请求遍历整个堆）
+_GC_TASK_INTERVAL = 64
+
+def _init_ocr_worker() -> None:
+    """
+    进程池工作进程初始化函数：预加载并预热OCR引擎
+    
+    每个工作进程启动时即加载自己的PaddleOCR实例，避免首个请求承担模型加载耗时
+    """
+    try:
+        from app.core.ocr_engine import warmup_ocr_engine
+        warmup_ocr_engine()
+    except Exception as e:
+        # 预加载失败不影响进程启动，首次请求时会再次尝试初始化
+        logger.warning(f"工作进程 {os.getpid()} 预加载OCR引擎失败: {str(e)}")
+
+def _get_mp_context():
+    """
+    获取进程池使用的多进程上下文
+    
+    优先使用forkserver：工作进程从预先导入OCR依赖的干净服务进程fork，
+    既避免从多线程的主进程直接fork，也避免spawn方式每个进程重新导入PaddleOCR
+    
+    Returns:
+        多进程上下文，不支持forkserver的平台（如Windows）返回None使用默认方式
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return None
+    ctx = multiprocessing.get_context("forkserver")
+    # 只导入模块，不创建OCR引擎，引擎由各工作进程的initializer加载
+    ctx.set_forkserver_preload(["app.core.ocr_engine"])
+    return ctx
+
 class ProcessPoolManager:
     """进程池管理器，用于处理CPU密集型任务"""
     
-    _instance = None
+    def __init__(self):
+        # 进程池在首次使用时才创建，仅导入本模块的进程（测试、命令行工具）不会启动工作进程
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        # 进程句柄延迟创建：Gunicorn预加载模式下管理器在主进程创建后被fork到各工作进程
+        self._process = None
+        self._last_memory_sample = 0.0
+        self._gc_counter = 0
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(ProcessPoolManager, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    def _ensure_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        """
+        获取进程池，首次调用时创建
+        
+        Returns:
+            进程池执行器
+        """
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = concurrent.futures.ProcessPoolExecutor(
+                        max_workers=OCR_PROCESS_POOL_SIZE,
+                        mp_context=_get_mp_context(),
+                        initializer=_init_ocr_worker
+                    )
+                    self._log_memory_usage("进程池初始化")
+                    logger.info(f"进程池已初始化，工作进程数: {OCR_PROCESS_POOL_SIZE} (内存优化模式: {MEMORY_OPTIMIZATION})")
+        return self._pool
     
-    def __init__(self):
-        if self._initialized:
-            return
-            
-        self._pool = concurrent.futures.ProcessPoolExecutor(
-            max_workers=OCR_PROCESS_POOL_SIZE
-        )
-        self._initialized = True
-        self._log_memory_usage("进程池初始化")
-        logger.info(f"进程池已初始化，工作进程数: {OCR_PROCESS_POOL_SIZE} (内存优化模式: {MEMORY_OPTIMIZATION})")
+    def _get_process(self) -> psutil.Process:
+        """
+        获取当前进程的psutil句柄，fork后（进程号变化）重新创建
+        
+        Returns:
+            当前进程的psutil.Process实例
+        """
+        if self._process is None or self._process.pid != os.getpid():
+            self._process = psutil.Process()
+        return self._process
     
     def _log_memory_usage(self, operation: str):
-        """记录内存使用情况"""
+        """记录内存使用情况（按时间间隔采样）"""
+        now = time.monotonic()
+        if now - self._last_memory_sample < _MEMORY_SAMPLE_INTERVAL:
+            return
+        self._last_memory_sample = now
+        
         try:
-            process = psutil.Process()
-            memory_info = process.memory_info()
+            memory_info = self._get_process().memory_info()
             memory_mb = memory_info.rss / 1024 / 1024
             
             if MEMORY_OPTIMIZATION:
@@ -78,10 +140,11 @@ class ProcessPoolManager:
             Exception: 任务执行失败
         """
         loop = asyncio.get_running_loop()
+        pool = self._ensure_pool()
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         if MEMORY_OPTIMIZATION:
-            logger.debug(f"开始执行任务: {func.__name__}")
+            logger.debug("开始执行任务: {}", func.__name__)
             self._log_memory_usage(f"任务开始-{func.__name__}")
         
         try:
@@ -90,47 +153,77 @@ class ProcessPoolManager:
                 # 如果有关键字参数，使用partial包装函数
                 func_with_kwargs = partial(func, *args, **kwargs)
                 result = await asyncio.wait_for(
-                    loop.run_in_executor(self._pool, func_with_kwargs),
+                    loop.run_in_executor(pool, func_with_kwargs),
                     timeout=OCR_TASK_TIMEOUT
                 )
             else:
                 result = await asyncio.wait_for(
-                    loop.run_in_executor(self._pool, func, *args),
+                    loop.run_in_executor(pool, func, *args),
                     timeout=OCR_TASK_TIMEOUT
                 )
             
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             
-            # 内存优化：任务完成后进行垃圾回收
+            # 内存优化：每完成一定数量的任务进行一次年轻代垃圾回收
             if ENABLE_GC_AFTER_REQUEST:
-                gc.collect()
+                self._gc_counter = (self._gc_counter + 1) % _GC_TASK_INTERVAL
+                if self._gc_counter == 0:
+                    gc.collect(1)
                 
+            logger.debug("任务 {} 执行完成，耗时: {:.2f}秒", func.__name__, execution_time)
             if MEMORY_OPTIMIZATION:
-                logger.debug(f"任务 {func.__name__} 执行完成，耗时: {execution_time:.2f}秒")
                 self._log_memory_usage(f"任务完成-{func.__name__}")
-            else:
-                logger.debug(f"任务 {func.__name__} 执行完成，耗时: {execution_time:.2f}秒")
                 
             return result
             
         except asyncio.TimeoutError:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             logger.error(f"任务 {func.__name__} 执行超时，已耗时: {execution_time:.2f}秒")
             raise TimeoutError(f"任务执行超时，超过 {OCR_TASK_TIMEOUT} 秒")
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             logger.error(f"任务 {func.__name__} 执行失败，耗时: {execution_time:.2f}秒，错误: {str(e)}")
             raise
     
+    async def warmup(self) -> None:
+        """
+        启动全部工作进程
+        
+        进程池按需创建工作进程，提交与进程数相同的空任务可让所有进程
+        在服务启动阶段完成初始化（含OCR引擎预热），而不是在首批请求中
+        """
+        loop = asyncio.get_running_loop()
+        pool = self._ensure_pool()
+        start_time = time.perf_counter()
+        try:
+            pids = await asyncio.gather(*[
+                loop.run_in_executor(pool, os.getpid)
+                for _ in range(OCR_PROCESS_POOL_SIZE)
+            ])
+            logger.info(f"进程池预热完成，已启动 {len(set(pids))} 个工作进程，耗时: {time.perf_counter() - start_time:.2f}秒")
+        except Exception as e:
+            logger.warning(f"进程池预热失败: {str(e)}")
+    
     def shutdown(self):
         """关闭进程池"""
-        if hasattr(self, '_pool'):
+        if self._pool is not None:
             self._pool.shutdown(wait=True)
+            self._pool = None
             logger.info("进程池已关闭")
 
+@lru_cache(maxsize=1)
+def get_process_pool_manager() -> ProcessPoolManager:
+    """
+    获取全局进程池管理器（单例）
+    
+    Returns:
+        进程池管理器实例
+    """
+    return ProcessPoolManager()
+
 # 全局进程池管理器实例
-process_pool_manager = ProcessPoolManager()
+process_pool_manager = get_process_pool_manager()
 
 # 在程序退出时关闭进程池
 import atexit
@@ -162,14 +255,18 @@ async def run_batch_tasks(
         # 并发执行所有任务
         return await asyncio.gather(*tasks, return_exceptions=True)
     else:
-        # 使用信号量限制并发数
-        semaphore = asyncio.Semaphore(max_concurrency)
+        # 固定数量的工作协程依次领取项目，同时在途的任务不超过max_concurrency个
+        results: List[Any] = [None] * len(items)
+        pending = iter(enumerate(items))
         
-        async def _run_with_semaphore(item):
-            async with semaphore:
-                return await process_pool_manager.run_task(func, item)
+        async def _worker():
+            # 事件循环单线程执行，多个工作协程共享迭代器是安全的
+            for index, item in pending:
+                try:
+                    results[index] = await process_pool_manager.run_task(func, item)
+                except Exception as e:
+                    # 与gather(return_exceptions=True)一致，异常作为结果返回
+                    results[index] = e
         
-        # 创建所有任务
-        tasks = [_run_with_semaphore(item) for item in items]
-        # 并发执行所有任务
-        return await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.gather(*[_worker() for _ in range(min(max_concurrency, len(items)))])
+        return results
@@ -30,17 +30,23 @@ logger.add(
     level=LOG_LEVEL,
     rotation=LOG_ROTATION,
     retention=LOG_RETENTION,
-    encoding="utf-8"
+    encoding="utf-8",
+    enqueue=True  # 日志先写入队列，由后台线程批量写文件，请求处理不等待磁盘IO
 )
 
+# 标准库日志级别名称到Loguru级别的映射，避免每条日志都查询级别
+_LEVEL_CACHE = {name: logger.level(name).name for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")}
+# 低于该级别的标准库日志不会被任何处理器输出，直接丢弃
+_MIN_LEVEL_NO = logger.level(LOG_LEVEL).no
+
 # 创建一个拦截标准库日志的处理器
 class InterceptHandler(logging.Handler):
     def emit(self, record):
+        if record.levelno < _MIN_LEVEL_NO:
+            return
+        
         # 获取对应的Loguru级别
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
+        level = _LEVEL_CACHE.get(record.levelname, record.levelno)
 
         # 查找调用者
         frame, depth = logging.currentframe(), 2
@@ -59,6 +65,9 @@ for _log_name in ["uvicorn", "uvicorn.error", "fastapi"]:
     _logger = logging.getLogger(_log_name)
     _logger.handlers = [InterceptHandler()]
 
+# 按名称缓存绑定后的logger，避免重复创建
+_logger_cache = {}
+
 # 定义一个函数来获取logger
 def get_logger(name: str = "sfzocr"):
     """
@@ -70,15 +79,20 @@ def get_logger(name: str = "sfzocr"):
     Returns:
         loguru.logger实例
     """
-    return logger.bind(name=name)
+    bound_logger = _logger_cache.get(name)
+    if bound_logger is None:
+        bound_logger = _logger_cache.setdefault(name, logger.bind(name=name))
+    return bound_logger
 
 # 定义请求日志记录函数
-async def log_request(request, response_status, response_time):
+def log_request(method: str, path: str, client_host: str, response_status: int, response_time: float):
     """
     记录HTTP请求日志
     
     Args:
-        request: FastAPI请求对象
+        method: 请求方法
+        path: 请求路径
+        client_host: 客户端地址
         response_status: 响应状态码
         response_time: 响应时间(ms)
     """
@@ -86,6 +100,6 @@ async def log_request(request, response_status, response_time):
     
     logger.log(
         level,
-        f"Request: {request.method} {request.url.path} | Status: {response_status} | Time: {response_time:.2f}ms | "
-        f"Client: {request.client.host if request.client else 'Unknown'}"
+        f"Request: {method} {path} | Status: {response_status} | Time: {response_time:.2f}ms | "
+        f"Client: {client_host}"
     )
@@ -2,8 +2,24 @@
 # -*- coding: utf-8 -*-
 
 import re
+import string
+from operator import mul
 from typing import Optional
 
+# 18位身份证号码正则表达式
+_ID_NUMBER_RE = re.compile(r'^[1-9]\d{5}(19|20)\d{2}(0[1-9]|1[0-2])(0[1-9]|[12]\d|3[01])\d{3}(\d|X|x)$')
+# base64字母表（不含填充字符"="），translate删除后为空即全部合法
+_BASE64_CHARS = (string.ascii_letters + string.digits + "+/").encode("ascii")
+# 中文姓名正则表达式（2-15个汉字）
+_CHINESE_NAME_RE = re.compile(r'^[\u4e00-\u9fa5]{2,15}$')
+# 出生日期格式
+_BIRTH_DATE_RE = re.compile(r'(\d{4})年(\d{1,2})月(\d{1,2})日')
+_BIRTH_DATE_LOOSE_RE = re.compile(r'(\d{4})[-.年/](\d{1,2})[-.月/](\d{1,2})[日]?')
+
+# 身份证校验位加权因子和校验码
+_CHECKSUM_FACTORS = (7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2)
+_CHECKSUM_MAP = '10X98765432'
+
 def validate_id_number(id_number: str) -> bool:
     """
     验证身份证号码格式
@@ -17,26 +33,14 @@ def validate_id_number(id_number: str) -> bool:
     if not id_number:
         return False
         
-    # 18位身份证号码正则表达式
-    pattern = r'^[1-9]\d{5}(19|20)\d{2}(0[1-9]|1[0-2])(0[1-9]|[12]\d|3[01])\d{3}(\d|X|x)$'
-    
-    if not re.match(pattern, id_number):
+    if not _ID_NUMBER_RE.match(id_number):
         return False
     
-    # 验证校验位
-    factors = [7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2]
-    checksum_map = '10X98765432'
-    
-    # 计算校验和
-    checksum = 0
-    for i in range(17):
-        checksum += int(id_number[i]) * factors[i]
-    
-    # 计算校验位
-    check_digit = checksum_map[checksum % 11]
+    # 计算校验和（map/sum在C层完成逐位加权求和）
+    checksum = sum(map(mul, map(int, id_number[:17]), _CHECKSUM_FACTORS))
     
     # 验证校验位
-    return str(check_digit).upper() == id_number[17].upper()
+    return _CHECKSUM_MAP[checksum % 11] == id_number[17].upper()
 
 def validate_image_base64(image_data: str) -> bool:
     """
@@ -52,12 +56,17 @@ def validate_image_base64(image_data: str) -> bool:
         return False
     
     # 移除可能的base64前缀
-    if "base64," in image_data:
-        image_data = image_data.split("base64,")[1]
+    prefix_end = image_data.find("base64,")
+    if prefix_end != -1:
+        image_data = image_data[prefix_end + 7:]
     
-    # 验证base64格式
-    pattern = r'^[A-Za-z0-9+/]+={0,2}$'
-    return bool(re.match(pattern, image_data))
+    # 验证base64格式：长度必须是4的倍数，末尾最多两个填充字符
+    if len(image_data) % 4 != 0:
+        return False
+    data = image_data.rstrip("=")
+    if not data or len(image_data) - len(data) > 2 or not data.isascii():
+        return False
+    return not data.encode("ascii").translate(None, _BASE64_CHARS)
 
 def validate_chinese_name(name: str) -> bool:
     """
@@ -72,9 +81,7 @@ def validate_chinese_name(name: str) -> bool:
     if not name:
         return False
     
-    # 中文姓名正则表达式（2-15个汉字）
-    pattern = r'^[\u4e00-\u9fa5]{2,15}$'
-    return bool(re.match(pattern, name))
+    return bool(_CHINESE_NAME_RE.match(name))
 
 def extract_birth_date(birth_text: str) -> Optional[str]:
     """
@@ -89,9 +96,16 @@ def extract_birth_date(birth_text: str) -> Optional[str]:
     if not birth_text:
         return None
     
+    # 快速路径：OCR最常见的整段"YYYY年M月D日"格式直接切片，无需正则
+    if 9 <= len(birth_text) <= 11 and birth_text[4] == '年' and birth_text[-1] == '日':
+        year = birth_text[:4]
+        month, sep, day = birth_text[5:-1].partition('月')
+        if (sep and year.isdecimal() and month.isdecimal() and day.isdecimal()
+                and len(month) <= 2 and len(day) <= 2):
+            return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+    
     # 提取年月日
-    pattern = r'(\d{4})年(\d{1,2})月(\d{1,2})日'
-    match = re.search(pattern, birth_text)
+    match = _BIRTH_DATE_RE.search(birth_text)
     
     if match:
         year = match.group(1)
@@ -100,8 +114,7 @@ def extract_birth_date(birth_text: str) -> Optional[str]:
         return f"{year}-{month}-{day}"
     
     # 尝试其他可能的格式
-    pattern = r'(\d{4})[-.年/](\d{1,2})[-.月/](\d{1,2})[日]?'
-    match = re.search(pattern, birth_text)
+    match = _BIRTH_DATE_LOOSE_RE.search(birth_text)
     
     if match:
         year = match.group(1)
@@ -23,16 +23,19 @@ def get_process_memory_info(process_name: str = "python") -> List[Dict]:
     """
     processes = []
     
-    for proc in psutil.process_iter(['pid', 'name', 'memory_info', 'cmdline']):
+    # 先只读取进程名称（开销最小），名称匹配后再读取命令行和内存信息
+    for proc in psutil.process_iter(['name']):
         try:
-            if process_name.lower() in proc.info['name'].lower():
+            name = proc.info['name'] or ''
+            if process_name.lower() in name.lower():
                 # 检查是否是OCR相关进程
-                cmdline = ' '.join(proc.info['cmdline']) if proc.info['cmdline'] else ''
+                cmdline_parts = proc.cmdline()
+                cmdline = ' '.join(cmdline_parts) if cmdline_parts else ''
                 if 'uvicorn' in cmdline or 'sfzocr' in cmdline or 'main:app' in cmdline:
-                    memory_mb = proc.info['memory_info'].rss / 1024 / 1024
+                    memory_mb = proc.memory_info().rss / 1024 / 1024
                     processes.append({
-                        'pid': proc.info['pid'],
-                        'name': proc.info['name'],
+                        'pid': proc.pid,
+                        'name': name,
                         'memory_mb': memory_mb,
                         'cmdline': cmdline
                     })
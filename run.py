@@ -3,10 +3,16 @@
 
 import os
 import sys
+import gc
 import argparse
-import uvicorn
 from pathlib import Path
 
+# Gunicorn为可选依赖（不支持Windows），未安装时使用uvicorn多进程模式
+try:
+    from gunicorn.app.base import BaseApplication
+except ImportError:
+    BaseApplication = None
+
 # 添加项目根目录到Python路径
 ROOT_DIR = Path(__file__).resolve().parent
 sys.path.insert(0, str(ROOT_DIR))
@@ -23,10 +29,23 @@ from app.config import (
     API_KEY_HEADER, API_KEYS, ALLOWED_HOSTS, CORS_ORIGINS,
     ID_CARD_CONFIG, OCR_PERFORMANCE_CONFIG, FOREIGN_ID_CARD_CONFIG,
     ENABLE_REQUEST_CACHE, CACHE_MAX_SIZE, CACHE_EXPIRE_TIME, 
-    CACHE_KEY_METHOD, CACHE_DEBUG_RESULTS, CACHE_ENABLE_STATS,
-    safe_print
+    CACHE_KEY_METHOD, CACHE_DEBUG_RESULTS, CACHE_ENABLE_STATS, GC_THRESHOLD,
+    MAX_REQUESTS_PER_WORKER, SERVER_LIMIT_CONCURRENCY, safe_print
 )
 
+def tune_gc():
+    """
+    调整垃圾回收参数
+    
+    提高第0代阈值，减少请求处理中大量临时对象（numpy数组、图像字节）频繁触发的回收；
+    并冻结目前已创建的对象（模块、配置等），后续回收不再重复扫描它们
+    """
+    if GC_THRESHOLD <= 0:
+        return
+    gc.set_threshold(GC_THRESHOLD, 10, 10)
+    gc.collect()
+    gc.freeze()
+
 def parse_args():
     """解析命令行参数"""
     parser = argparse.ArgumentParser(description="身份证OCR识别服务启动脚本")
@@ -75,162 +94,192 @@ def display_startup_info(args):
     effective_workers = args.workers
     effective_log_level = args.log_level.lower() if not args.debug else "debug"
     
-    safe_print("=" * 80)
-    safe_print(f"🚀 {PROJECT_NAME} v{VERSION} 启动中...")
-    safe_print("=" * 80)
+    # 先收集所有行，最后一次性输出
+    lines = []
+    
+    lines.append("=" * 80)
+    lines.append(f"🚀 {PROJECT_NAME} v{VERSION} 启动中...")
+    lines.append("=" * 80)
     
     # 服务基本配置
-    safe_print("📡 服务配置:")
-    safe_print(f"  └─ 服务地址: http://{args.host}:{args.port}")
-    safe_print(f"  └─ Worker进程数: {effective_workers}")
-    safe_print(f"  └─ 调试模式: {'启用' if args.debug else '禁用'}")
-    safe_print(f"  └─ 日志级别: {effective_log_level.upper()}")
-    safe_print("")
+    lines.append("📡 服务配置:")
+    lines.append(f"  └─ 服务地址: http://{args.host}:{args.port}")
+    lines.append(f"  └─ Worker进程数: {effective_workers}")
+    lines.append(f"  └─ 调试模式: {'启用' if args.debug else '禁用'}")
+    lines.append(f"  └─ 日志级别: {effective_log_level.upper()}")
+    lines.append("")
     
     # 性能配置
-    safe_print("⚡ 性能配置:")
-    safe_print(f"  └─ 最大并发请求: {MAX_CONCURRENT_REQUESTS}")
-    safe_print(f"  └─ OCR进程池大小: {OCR_PROCESS_POOL_SIZE}")
-    safe_print(f"  └─ OCR任务超时: {OCR_TASK_TIMEOUT}秒")
-    safe_print(f"  └─ 内存优化: {'启用' if MEMORY_OPTIMIZATION else '禁用'}")
-    safe_print(f"  └─ 请求后垃圾回收: {'启用' if ENABLE_GC_AFTER_REQUEST else '禁用'}")
-    safe_print("")
+    lines.append("⚡ 性能配置:")
+    lines.append(f"  └─ 最大并发请求: {MAX_CONCURRENT_REQUESTS}")
+    lines.append(f"  └─ 连接并发上限: {SERVER_LIMIT_CONCURRENCY if SERVER_LIMIT_CONCURRENCY > 0 else '不限制（Gunicorn模式为默认值1000）'}")
+    lines.append(f"  └─ OCR进程池大小: {OCR_PROCESS_POOL_SIZE}")
+    lines.append(f"  └─ OCR任务超时: {OCR_TASK_TIMEOUT}秒")
+    lines.append(f"  └─ 内存优化: {'启用' if MEMORY_OPTIMIZATION else '禁用'}")
+    lines.append(f"  └─ 请求后垃圾回收: {'启用' if ENABLE_GC_AFTER_REQUEST else '禁用'}")
+    lines.append("")
     
     # 缓存配置
-    safe_print("🗄️ 缓存配置:")
-    safe_print(f"  └─ 请求缓存: {'启用' if ENABLE_REQUEST_CACHE else '禁用'}")
+    lines.append("🗄️ 缓存配置:")
+    lines.append(f"  └─ 请求缓存: {'启用' if ENABLE_REQUEST_CACHE else '禁用'}")
     if ENABLE_REQUEST_CACHE:
-        safe_print(f"  └─ 缓存容量: {CACHE_MAX_SIZE}个")
-        safe_print(f"  └─ 过期时间: {CACHE_EXPIRE_TIME}秒 ({CACHE_EXPIRE_TIME//60}分钟)")
-        safe_print(f"  └─ 键算法: {CACHE_KEY_METHOD.upper()}")
-        safe_print(f"  └─ 缓存调试结果: {'启用' if CACHE_DEBUG_RESULTS else '禁用'}")
-        safe_print(f"  └─ 缓存统计: {'启用' if CACHE_ENABLE_STATS else '禁用'}")
+        lines.append(f"  └─ 缓存容量: {CACHE_MAX_SIZE}个")
+        lines.append(f"  └─ 过期时间: {CACHE_EXPIRE_TIME}秒 ({CACHE_EXPIRE_TIME//60}分钟)")
+        lines.append(f"  └─ 键算法: {CACHE_KEY_METHOD.upper()}")
+        lines.append(f"  └─ 缓存调试结果: {'启用' if CACHE_DEBUG_RESULTS else '禁用'}")
+        lines.append(f"  └─ 缓存统计: {'启用' if CACHE_ENABLE_STATS else '禁用'}")
         # 计算缓存预估内存占用
         cache_memory_mb = CACHE_MAX_SIZE * 3  # 每项约3KB
         if cache_memory_mb >= 1024:
-            safe_print(f"  └─ 预估内存占用: ~{cache_memory_mb/1024:.1f}GB")
+            lines.append(f"  └─ 预估内存占用: ~{cache_memory_mb/1024:.1f}GB")
         else:
-            safe_print(f"  └─ 预估内存占用: ~{cache_memory_mb}MB")
+            lines.append(f"  └─ 预估内存占用: ~{cache_memory_mb}MB")
     else:
-        safe_print(f"  └─ 注意: 禁用缓存可能影响重复请求的响应速度")
-    safe_print("")
+        lines.append(f"  └─ 注意: 禁用缓存可能影响重复请求的响应速度")
+    lines.append("")
     
     # OCR引擎配置
-    safe_print("🔍 OCR引擎配置:")
-    safe_print(f"  └─ 模型目录: {OCR_MODEL_DIR}")
-    safe_print(f"  └─ 使用角度分类器: {'启用' if ID_CARD_CONFIG.get('use_angle_cls', False) else '禁用'}")
-    safe_print(f"  └─ 文本检测: {'启用' if ID_CARD_CONFIG.get('det', True) else '禁用'}")
-    safe_print(f"  └─ 文本识别: {'启用' if ID_CARD_CONFIG.get('rec', True) else '禁用'}")
-    safe_print(f"  └─ 方向分类: {'启用' if ID_CARD_CONFIG.get('cls', True) else '禁用'}")
+    lines.append("🔍 OCR引擎配置:")
+    lines.append(f"  └─ 模型目录: {OCR_MODEL_DIR}")
+    lines.append(f"  └─ 使用角度分类器: {'启用' if ID_CARD_CONFIG.get('use_angle_cls', False) else '禁用'}")
+    lines.append(f"  └─ 文本检测: {'启用' if ID_CARD_CONFIG.get('det', True) else '禁用'}")
+    lines.append(f"  └─ 文本识别: {'启用' if ID_CARD_CONFIG.get('rec', True) else '禁用'}")
+    lines.append(f"  └─ 方向分类: {'启用' if ID_CARD_CONFIG.get('cls', True) else '禁用'}")
     
     # OCR性能优化配置
-    safe_print(f"  └─ 性能优化:")
-    safe_print(f"      ├─ 快速模式: {'启用' if OCR_PERFORMANCE_CONFIG.get('enable_fast_mode', False) else '禁用'}")
-    safe_print(f"      ├─ 内存优化: {'启用' if OCR_PERFORMANCE_CONFIG.get('enable_memory_optimization', True) else '禁用'}")
-    safe_print(f"      ├─ CPU线程数: {OCR_PERFORMANCE_CONFIG.get('cpu_threads', 4)}")
-    safe_print(f"      ├─ 检测阈值: {OCR_PERFORMANCE_CONFIG.get('det_db_thresh', 0.3)}")
-    safe_print(f"      ├─ 识别批次: {OCR_PERFORMANCE_CONFIG.get('rec_batch_num', 6)}")
-    safe_print(f"      ├─ 最大文本长度: {OCR_PERFORMANCE_CONFIG.get('max_text_length', 25)}")
-    safe_print(f"      └─ 图像大小限制: {OCR_PERFORMANCE_CONFIG.get('max_image_size', 4096)}px")
+    lines.append(f"  └─ 性能优化:")
+    lines.append(f"      ├─ 快速模式: {'启用' if OCR_PERFORMANCE_CONFIG.get('enable_fast_mode', False) else '禁用'}")
+    lines.append(f"      ├─ 内存优化: {'启用' if OCR_PERFORMANCE_CONFIG.get('enable_memory_optimization', True) else '禁用'}")
+    lines.append(f"      ├─ CPU线程数: {OCR_PERFORMANCE_CONFIG.get('cpu_threads', 4)}")
+    lines.append(f"      ├─ 检测阈值: {OCR_PERFORMANCE_CONFIG.get('det_db_thresh', 0.3)}")
+    lines.append(f"      ├─ 识别批次: {OCR_PERFORMANCE_CONFIG.get('rec_batch_num', 16)}")
+    lines.append(f"      ├─ 最大文本长度: {OCR_PERFORMANCE_CONFIG.get('max_text_length', 25)}")
+    lines.append(f"      ├─ 图像大小限制: {OCR_PERFORMANCE_CONFIG.get('max_image_size', 4096)}px")
+    lines.append(f"      └─ 工作进程回收: {f'每{MAX_REQUESTS_PER_WORKER}个请求' if MAX_REQUESTS_PER_WORKER > 0 else '禁用'}")
     
     # 支持的证件类型
-    safe_print(f"  └─ 支持证件类型:")
-    safe_print(f"      ├─ 中国居民身份证（正面/背面）")
-    safe_print(f"      ├─ 新版外国人永久居留身份证")
-    safe_print(f"      └─ 旧版外国人永久居留身份证")
+    lines.append(f"  └─ 支持证件类型:")
+    lines.append(f"      ├─ 中国居民身份证（正面/背面）")
+    lines.append(f"      ├─ 新版外国人永久居留身份证")
+    lines.append(f"      └─ 旧版外国人永久居留身份证")
     
     # 检查模型目录
     if os.path.exists(OCR_MODEL_DIR):
-        safe_print(f"  └─ 模型路径状态: {OCR_MODEL_DIR} ✅")
+        lines.append(f"  └─ 模型路径状态: {OCR_MODEL_DIR} ✅")
     else:
-        safe_print(f"  └─ 模型路径状态: {OCR_MODEL_DIR} ❌ (将使用默认模型)")
-    safe_print("")
+        lines.append(f"  └─ 模型路径状态: {OCR_MODEL_DIR} ❌ (将使用默认模型)")
+    lines.append("")
     
     # 日志配置
-    safe_print("📝 日志配置:")
-    safe_print(f"  └─ 日志目录: {LOG_DIR}")
-    safe_print(f"  └─ 日志文件: {LOG_FILENAME}")
-    safe_print(f"  └─ 文件轮转: {LOG_ROTATION}")
-    safe_print(f"  └─ 保留时间: {LOG_RETENTION}")
-    safe_print("")
+    lines.append("📝 日志配置:")
+    lines.append(f"  └─ 日志目录: {LOG_DIR}")
+    lines.append(f"  └─ 日志文件: {LOG_FILENAME}")
+    lines.append(f"  └─ 文件轮转: {LOG_ROTATION}")
+    lines.append(f"  └─ 保留时间: {LOG_RETENTION}")
+    lines.append("")
     
     # 安全配置
-    safe_print("🔐 安全配置:")
+    lines.append("🔐 安全配置:")
     if API_KEYS and any(key.strip() for key in API_KEYS):
         valid_keys = [key for key in API_KEYS if key.strip()]
         api_key_display = f"{valid_keys[0][:8]}..." if len(valid_keys[0]) > 8 else valid_keys[0]
-        safe_print(f"  └─ API密钥验证: 启用 ({len(valid_keys)}个密钥)")
-        safe_print(f"  └─ 示例密钥: {api_key_display}")
-        safe_print(f"  └─ 密钥请求头: {API_KEY_HEADER}")
+        lines.append(f"  └─ API密钥验证: 启用 ({len(valid_keys)}个密钥)")
+        lines.append(f"  └─ 示例密钥: {api_key_display}")
+        lines.append(f"  └─ 密钥请求头: {API_KEY_HEADER}")
     else:
-        safe_print(f"  └─ API密钥验证: 禁用")
-        safe_print(f"  └─ ⚠️  建议: 生产环境应启用API密钥验证")
+        lines.append(f"  └─ API密钥验证: 禁用")
+        lines.append(f"  └─ ⚠️  建议: 生产环境应启用API密钥验证")
     
-    safe_print(f"  └─ 允许的主机: {', '.join(ALLOWED_HOSTS[:3])}")
+    lines.append(f"  └─ 允许的主机: {', '.join(ALLOWED_HOSTS[:3])}")
     if len(ALLOWED_HOSTS) > 3:
-        safe_print(f"  └─              ...等{len(ALLOWED_HOSTS)}个")
+        lines.append(f"  └─              ...等{len(ALLOWED_HOSTS)}个")
     
     # CORS配置
-    safe_print(f"  └─ CORS跨域:")
+    lines.append(f"  └─ CORS跨域:")
     if CORS_ORIGINS == ["*"]:
-        safe_print(f"      ├─ 允许所有来源 (*)")
-        safe_print(f"      └─ ⚠️  建议: 生产环境应限制具体域名")
+        lines.append(f"      ├─ 允许所有来源 (*)")
+        lines.append(f"      └─ ⚠️  建议: 生产环境应限制具体域名")
     elif len(CORS_ORIGINS) == 0:
-        safe_print(f"      └─ 禁用跨域访问")
+        lines.append(f"      └─ 禁用跨域访问")
     else:
-        safe_print(f"      ├─ 允许域名: {len(CORS_ORIGINS)}个")
+        lines.append(f"      ├─ 允许域名: {len(CORS_ORIGINS)}个")
         for i, origin in enumerate(CORS_ORIGINS[:3]):
             prefix = "├─" if i < min(2, len(CORS_ORIGINS)-1) else "└─"
-            safe_print(f"      {prefix} {origin}")
+            lines.append(f"      {prefix} {origin}")
         if len(CORS_ORIGINS) > 3:
-            safe_print(f"      └─ ...等{len(CORS_ORIGINS)}个域名")
-    safe_print("")
+            lines.append(f"      └─ ...等{len(CORS_ORIGINS)}个域名")
+    lines.append("")
     
     # 性能评估和建议
-    safe_print("💡 性能评估:")
+    lines.append("💡 性能评估:")
     estimated_memory = OCR_PROCESS_POOL_SIZE * 1.2  # 每个OCR进程约1.2GB
     total_memory = estimated_memory + (effective_workers * 0.5)  # 加上uvicorn进程内存
     
     if effective_workers == 1:
-        safe_print(f"  └─ 部署模式: 开发/测试模式")
-        safe_print(f"  └─ 预估内存需求: ~{total_memory:.1f}GB")
-        safe_print(f"  └─ 并发能力: 低 (适合内存受限环境)")
-        safe_print(f"  └─ 优化建议: 生产环境建议增加进程数")
-        safe_print(f"      export WORKERS=4  或  python run.py --workers 4")
+        lines.append(f"  └─ 部署模式: 开发/测试模式")
+        lines.append(f"  └─ 预估内存需求: ~{total_memory:.1f}GB")
+        lines.append(f"  └─ 并发能力: 低 (适合内存受限环境)")
+        lines.append(f"  └─ 优化建议: 生产环境建议增加进程数")
+        lines.append(f"      export WORKERS=4  或  python run.py --workers 4")
     elif effective_workers <= 4:
-        safe_print(f"  └─ 部署模式: 生产标准模式")
-        safe_print(f"  └─ 预估内存需求: ~{total_memory:.1f}GB")
-        safe_print(f"  └─ 并发能力: 中等 (推荐)")
+        lines.append(f"  └─ 部署模式: 生产标准模式")
+        lines.append(f"  └─ 预估内存需求: ~{total_memory:.1f}GB")
+        lines.append(f"  └─ 并发能力: 中等 (推荐)")
     elif effective_workers <= 8:
-        safe_print(f"  └─ 部署模式: 高性能模式")
-        safe_print(f"  └─ 预估内存需求: ~{total_memory:.1f}GB")
-        safe_print(f"  └─ 并发能力: 高")
+        lines.append(f"  └─ 部署模式: 高性能模式")
+        lines.append(f"  └─ 预估内存需求: ~{total_memory:.1f}GB")
+        lines.append(f"  └─ 并发能力: 高")
     else:
-        safe_print(f"  └─ 部署模式: 超高性能模式")
-        safe_print(f"  └─ 预估内存需求: ~{total_memory:.1f}GB")
-        safe_print(f"  └─ 并发能力: 超高")
-        safe_print(f"  └─ ⚠️  警告: 请确保服务器有足够内存支持")
+        lines.append(f"  └─ 部署模式: 超高性能模式")
+        lines.append(f"  └─ 预估内存需求: ~{total_memory:.1f}GB")
+        lines.append(f"  └─ 并发能力: 超高")
+        lines.append(f"  └─ ⚠️  警告: 请确保服务器有足够内存支持")
     
     # 内存优化提示
     if not MEMORY_OPTIMIZATION and total_memory > 4:
-        safe_print(f"  └─ 💾 建议: 启用内存优化 (export MEMORY_OPTIMIZATION=True)")
-    
-    safe_print("")
-    safe_print("🌐 API接口文档:")
-    safe_print(f"  └─ Swagger UI: http://{args.host}:{args.port}/docs")
-    safe_print(f"  └─ ReDoc: http://{args.host}:{args.port}/redoc")
-    safe_print(f"  └─ 健康检查: http://{args.host}:{args.port}/api/v1/health")
-    safe_print("")
-    
-    safe_print("=" * 80)
-    safe_print("🎯 服务启动完成，等待请求...")
-    safe_print("=" * 80)
-    safe_print("")
+        lines.append(f"  └─ 💾 建议: 启用内存优化 (export MEMORY_OPTIMIZATION=True)")
+    
+    lines.append("")
+    lines.append("🌐 API接口文档:")
+    lines.append(f"  └─ Swagger UI: http://{args.host}:{args.port}/docs")
+    lines.append(f"  └─ ReDoc: http://{args.host}:{args.port}/redoc")
+    lines.append(f"  └─ 健康检查: http://{args.host}:{args.port}/api/v1/health")
+    lines.append("")
+    
+    lines.append("=" * 80)
+    lines.append("🎯 服务启动完成，等待请求...")
+    lines.append("=" * 80)
+    lines.append("")
+    
+    safe_print("\n".join(lines))
+
+if BaseApplication is not None:
+    class StandaloneApplication(BaseApplication):
+        """在run.py中直接启动Gunicorn（UvicornWorker），预加载应用后fork工作进程"""
+        
+        def __init__(self, app_uri: str, options: dict):
+            self.app_uri = app_uri
+            self.options = options
+            super().__init__()
+        
+        def load_config(self):
+            for key, value in self.options.items():
+                if key in self.cfg.settings and value is not None:
+                    self.cfg.set(key, value)
+        
+        def load(self):
+            from app.main import app
+            # 预加载应用后再次冻结，fork出的工作进程不再扫描这些对象
+            tune_gc()
+            return app
 
 def main():
     """主函数"""
     args = parse_args()
     
+    # 调整垃圾回收参数
+    tune_gc()
+    
     # 显示启动配置信息
     display_startup_info(args)
     
@@ -238,7 +287,33 @@ def main():
     effective_workers = args.workers
     effective_log_level = args.log_level.lower() if not args.debug else "debug"
     
-    # 启动服务
+    # 多进程生产模式：Gunicorn预加载应用，工作进程通过fork共享已导入的模块（PaddleOCR等）
+    if BaseApplication is not None and not args.debug and effective_workers > 1:
+        options = {
+            "bind": f"{args.host}:{args.port}",
+            "workers": effective_workers,
+            "worker_class": "uvicorn.workers.UvicornWorker",
+            "preload_app": True,
+            "loglevel": effective_log_level,
+            # 工作进程启动时需预热OCR进程池，超时时间需覆盖模型加载和单个OCR任务
+            "timeout": max(120, OCR_TASK_TIMEOUT + 30),
+            "backlog": 2048,
+            "keepalive": 5,
+            # 工作进程处理一定数量请求后由Gunicorn重启，限制内存长期增长
+            "max_requests": MAX_REQUESTS_PER_WORKER,
+            "max_requests_jitter": MAX_REQUESTS_PER_WORKER // 10,
+        }
+        # UvicornWorker将worker_connections映射为limit_concurrency，超出时直接返回503
+        # （统计所有打开的连接，OCR任务并发由进程池控制，这里只防止连接无限堆积）；
+        # 设为0时不传入，使用Gunicorn默认值1000（worker_connections不支持“不限制”）
+        if SERVER_LIMIT_CONCURRENCY > 0:
+            options["worker_connections"] = SERVER_LIMIT_CONCURRENCY
+        StandaloneApplication("app.main:app", options).run()
+        return
+    
+    # 启动服务（调试模式、单进程或未安装Gunicorn）
+    # 延迟导入uvicorn：仅查看--help或走Gunicorn分支时无需加载
+    import uvicorn
     uvicorn.run(
         "app.main:app",
         host=args.host,
@@ -246,6 +321,12 @@ def main():
         workers=effective_workers,
         reload=args.debug,  # 调试模式下启用自动重载
         log_level=effective_log_level,
+        access_log=False,  # 请求日志由应用的RequestLogMiddleware统一记录（含文件轮转）
+        loop="auto",  # 已安装uvloop时自动使用，否则回退asyncio
+        http="auto",  # 已安装httptools时自动使用，否则回退h11
+        limit_concurrency=SERVER_LIMIT_CONCURRENCY or None,  # 连接数超出上限时直接返回503，避免请求无限堆积
+        backlog=2048,
+        timeout_keep_alive=5,
     )
 
 if __name__ == "__main__":
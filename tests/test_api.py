@@ -8,10 +8,37 @@
 import os
 import sys
 import json
+import mmap
 import base64
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# 复用同一个会话，多次请求之间保持连接（keep-alive），避免重复建立TCP连接
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+SESSION.headers["Connection"] = "keep-alive"
+
+# 可选依赖：orjson（更快的JSON解析/序列化），未安装时回退到标准库json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _loads(content):
+    """解析响应体JSON"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _dumps_pretty(obj):
+    """格式化输出JSON（缩进2格，保留中文）"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2)
 
 def read_image_as_base64(image_path):
     """
@@ -24,7 +51,15 @@ def read_image_as_base64(image_path):
         base64编码的图片数据
     """
     with open(image_path, "rb") as f:
-        return base64.b64encode(f.read()).decode("utf-8")
+        # 空文件无法映射，直接返回空字符串
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        # 内存映射文件，省去一次完整读入的拷贝；base64结果只含ASCII字符
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return base64.b64encode(mm).decode("ascii")
+        finally:
+            mm.close()
 
 def test_health_api(base_url):
     """
@@ -38,11 +73,12 @@ def test_health_api(base_url):
     print(f"\n正在测试健康检查API: {url}")
     
     try:
-        response = requests.get(url)
+        response = SESSION.get(url)
         print(f"状态码: {response.status_code}")
-        print(f"响应内容: {json.dumps(response.json(), ensure_ascii=False, indent=2)}")
+        result = _loads(response.content)
+        print(f"响应内容: {_dumps_pretty(result)}")
         
-        if response.status_code == 200 and response.json().get("code") == 0:
+        if response.status_code == 200 and result.get("code") == 0:
             print("✓ 健康检查API测试通过")
         else:
             print("✗ 健康检查API测试失败")
@@ -75,11 +111,12 @@ def test_idcard_api(base_url, image_path, side="front"):
         }
         
         # 发送请求
-        response = requests.post(url, json=data)
+        response = SESSION.post(url, json=data)
         print(f"状态码: {response.status_code}")
-        print(f"响应内容: {json.dumps(response.json(), ensure_ascii=False, indent=2)}")
+        result = _loads(response.content)
+        print(f"响应内容: {_dumps_pretty(result)}")
         
-        if response.status_code == 200 and response.json().get("code") == 0:
+        if response.status_code == 200 and result.get("code") == 0:
             print("✓ 身份证识别API测试通过")
         else:
             print("✗ 身份证识别API测试失败")
@@ -102,9 +139,8 @@ def test_idcard_upload_api(base_url, image_path, side="front"):
     print(f"身份证面: {side}")
     
     try:
-        # 打开图片文件
-        with open(image_path, "rb") as f:
-            image_file = f.read()
+        # 直接传入文件句柄，不预先读取整个文件内容
+        image_file = open(image_path, "rb")
         
         # 构造multipart/form-data请求
         files = {
@@ -115,11 +151,15 @@ def test_idcard_upload_api(base_url, image_path, side="front"):
         }
         
         # 发送请求
-        response = requests.post(url, files=files, data=data)
+        try:
+            response = SESSION.post(url, files=files, data=data)
+        finally:
+            image_file.close()
         print(f"状态码: {response.status_code}")
-        print(f"响应内容: {json.dumps(response.json(), ensure_ascii=False, indent=2)}")
+        result = _loads(response.content)
+        print(f"响应内容: {_dumps_pretty(result)}")
         
-        if response.status_code == 200 and response.json().get("code") == 0:
+        if response.status_code == 200 and result.get("code") == 0:
             print("✓ 身份证识别文件上传API测试通过")
         else:
             print("✗ 身份证识别文件上传API测试失败")
@@ -154,11 +194,12 @@ def test_batch_idcard_api(base_url, image_paths):
         }
         
         # 发送请求
-        response = requests.post(url, json=data)
+        response = SESSION.post(url, json=data)
         print(f"状态码: {response.status_code}")
-        print(f"响应内容: {json.dumps(response.json(), ensure_ascii=False, indent=2)}")
+        result = _loads(response.content)
+        print(f"响应内容: {_dumps_pretty(result)}")
         
-        if response.status_code == 200 and response.json().get("code") == 0:
+        if response.status_code == 200 and result.get("code") == 0:
             print("✓ 批量身份证识别API测试通过")
         else:
             print("✗ 批量身份证识别API测试失败")
@@ -184,24 +225,25 @@ def test_batch_idcard_upload_api(base_url, front_image_path=None, back_image_pat
         # 构造multipart/form-data请求
         files = {}
         
-        # 添加正面图片
-        if front_image_path:
-            with open(front_image_path, "rb") as f:
-                front_file = f.read()
-            files["front_image"] = (os.path.basename(front_image_path), front_file, "image/jpeg")
-        
-        # 添加背面图片
-        if back_image_path:
-            with open(back_image_path, "rb") as f:
-                back_file = f.read()
-            files["back_image"] = (os.path.basename(back_image_path), back_file, "image/jpeg")
-        
-        # 发送请求
-        response = requests.post(url, files=files)
+        # 发送请求（直接传入文件句柄，请求结束后统一关闭）
+        try:
+            # 添加正面图片
+            if front_image_path:
+                files["front_image"] = (os.path.basename(front_image_path), open(front_image_path, "rb"), "image/jpeg")
+            
+            # 添加背面图片
+            if back_image_path:
+                files["back_image"] = (os.path.basename(back_image_path), open(back_image_path, "rb"), "image/jpeg")
+            
+            response = SESSION.post(url, files=files)
+        finally:
+            for _, file_obj, _ in files.values():
+                file_obj.close()
         print(f"状态码: {response.status_code}")
-        print(f"响应内容: {json.dumps(response.json(), ensure_ascii=False, indent=2)}")
+        result = _loads(response.content)
+        print(f"响应内容: {_dumps_pretty(result)}")
         
-        if response.status_code == 200 and response.json().get("code") == 0:
+        if response.status_code == 200 and result.get("code") == 0:
             print("✓ 批量身份证识别文件上传API测试通过")
         else:
             print("✗ 批量身份证识别文件上传API测试失败")
@@ -257,30 +299,47 @@ def main():
         help="使用文件上传API进行测试"
     )
     
+    parser.add_argument(
+        "--serial", 
+        action="store_true", 
+        help="按顺序逐个执行测试（默认并发执行，便于调试时使用）"
+    )
+    
     args = parser.parse_args()
     
+    # 收集需要执行的测试，格式为[(测试函数, 参数元组)]
+    tests = []
+    
     # 测试健康检查API
     if args.health or not (args.image or (args.front and args.back)):
-        test_health_api(args.url)
+        tests.append((test_health_api, (args.url,)))
     
     # 测试单张身份证识别API
     if args.image:
         if args.upload:
-            test_idcard_upload_api(args.url, args.image, args.side)
+            tests.append((test_idcard_upload_api, (args.url, args.image, args.side)))
         else:
-            test_idcard_api(args.url, args.image, args.side)
+            tests.append((test_idcard_api, (args.url, args.image, args.side)))
     
     # 测试批量身份证识别API
     if args.front or args.back:
         if args.upload:
-            test_batch_idcard_upload_api(args.url, args.front, args.back)
+            tests.append((test_batch_idcard_upload_api, (args.url, args.front, args.back)))
         else:
             if args.front and args.back:
                 image_paths = [
                     (args.front, "front"),
                     (args.back, "back")
                 ]
-                test_batch_idcard_api(args.url, image_paths)
+                tests.append((test_batch_idcard_api, (args.url, image_paths)))
+    
+    # 各测试之间互不依赖，默认并发发送请求（共享同一个SESSION）
+    if args.serial or len(tests) <= 1:
+        for fn, fn_args in tests:
+            fn(*fn_args)
+    else:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda t: t[0](*t[1]), tests))
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -4,8 +4,9 @@
 测试真实外国人身份证英文姓名提取
 """
 
+import os
+import re
 import sys
-import base64
 from pathlib import Path
 
 # 添加项目根目录到Python路径
@@ -14,6 +15,24 @@ sys.path.insert(0, str(ROOT_DIR))
 
 from app.core.ocr_engine import extract_id_card_info
 
+# 英文姓名候选：大写字母开头，仅含大写字母、空格及常见分隔符，总长度超过8个字符
+_ENG_NAME_RE = re.compile(r'^[A-Z][A-Z\s.,\-]{8,}$')
+
+def _fmt_result(title, result):
+    """
+    格式化识别结果，整块一次输出
+    
+    Args:
+        title: 标题行
+        result: 识别结果字典
+        
+    Returns:
+        格式化后的多行文本
+    """
+    lines = [title]
+    lines.extend(f"  {'✅' if value else '❌'} {key}: {value}" for key, value in result.items())
+    return "\n".join(lines)
+
 def test_with_actual_image():
     """使用实际图像测试"""
     print("🧪 使用实际图像测试外国人身份证识别")
@@ -25,15 +44,20 @@ def test_with_actual_image():
         "wgsfzx.png"   # 还有这个文件
     ]
     
+    # 一次列出当前目录下的文件，避免逐个检查文件是否存在
+    present = {entry.name for entry in os.scandir('.') if entry.is_file()}
+    
     for image_file in test_images:
-        if Path(image_file).exists():
+        if image_file in present:
             print(f"\n📷 测试图像: {image_file}")
             print("-" * 30)
             
             # 读取图像
             try:
+                # 直接传入二进制数据，省去base64编码及每次识别时的重复解码；
+                # 同一图像的OCR结果由引擎按图像哈希缓存，后续三次识别只重新解析字段
                 with open(image_file, "rb") as f:
-                    image_data = base64.b64encode(f.read()).decode()
+                    image_data = f.read()
                 
                 # 先测试调试模式，看原始OCR输出
                 print("🔍 调试模式 - 原始OCR输出:")
@@ -46,9 +70,8 @@ def test_with_actual_image():
                     
                     # 检查是否有潜在的英文姓名
                     print("\n🔍 分析英文姓名候选:")
-                    for text in debug_result["ocr_text"]:
-                        if len(text) > 8 and text.isupper():
-                            print(f"  ✓ 候选: {text}")
+                    for text in filter(_ENG_NAME_RE.match, debug_result["ocr_text"]):
+                        print(f"  ✓ 候选: {text}")
                 else:
                     print("❌ 调试结果中没有OCR文本")
                 
@@ -56,28 +79,19 @@ def test_with_actual_image():
                 print("\n🎯 正式识别 - 旧版模式:")
                 result_old = extract_id_card_info(image_data, card_type="foreign_old", debug=False)
                 
-                print("📊 旧版识别结果:")
-                for key, value in result_old.items():
-                    status = "✅" if value else "❌"
-                    print(f"  {status} {key}: {value}")
+                print(_fmt_result("📊 旧版识别结果:", result_old))
                 
                 # 测试新版模式
                 print("\n🎯 正式识别 - 新版模式:")
                 result_new = extract_id_card_info(image_data, card_type="foreign_new", debug=False)
                 
-                print("📊 新版识别结果:")
-                for key, value in result_new.items():
-                    status = "✅" if value else "❌"
-                    print(f"  {status} {key}: {value}")
+                print(_fmt_result("📊 新版识别结果:", result_new))
                 
                 # 测试自动检测
                 print("\n🎯 正式识别 - 自动检测:")
                 result_auto = extract_id_card_info(image_data, card_type="auto", debug=False)
                 
-                print("📊 自动检测结果:")
-                for key, value in result_auto.items():
-                    status = "✅" if value else "❌"
-                    print(f"  {status} {key}: {value}")
+                print(_fmt_result("📊 自动检测结果:", result_auto))
                 
                 return result_old, result_new, result_auto
                 